@@ -263,11 +263,29 @@ def _run_sqlite_migrations():
     conn.close()
 
 
+def _ensure_signal_indexes():
+    """
+    Create Signal/LeadEvent read-path indexes on existing databases.
+    create_all() only adds indexes together with new tables, so databases
+    created before the indexes were declared need them added here.
+    Runs for both SQLite and PostgreSQL.
+    """
+    from models import Signal, LeadEvent
+    
+    for table in (Signal.__table__, LeadEvent.__table__):
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except Exception as e:
+                print(f"[MIGRATION] Could not create index {index.name}: {e}")
+
+
 def create_db_and_tables():
     """Create database tables if they don't exist and initialize SystemSettings."""
     SQLModel.metadata.create_all(engine)
     
     _run_sqlite_migrations()
+    _ensure_signal_indexes()
     
     from models import SystemSettings
     with Session(engine) as session:
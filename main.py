@@ -636,7 +636,8 @@ async def autopilot_loop():
                     generate_new_leads_from_source(session)
                     
                     # Step 2-3: Run SignalNet pipeline (fetches, scores, converts to LeadEvents)
-                    run_signals_agent(session)
+                    # Off the event loop so blocking source HTTP doesn't stall request handling
+                    await asyncio.to_thread(run_signals_agent, session)
                     
                     # Step 4: Enrich unenriched LeadEvents (batch of up to 15 per cycle)
                     try:
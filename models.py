@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 
 
@@ -275,6 +276,10 @@ class Signal(SQLModel, table=True):
     
     Metadata stores extracted contact info from source (URLs, emails, phones).
     """
+    __table_args__ = (
+        Index("ix_signal_created_at", "created_at"),  # Admin recent-signals feed
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     company_id: Optional[int] = Field(default=None, foreign_key="customer.id")
     lead_id: Optional[int] = Field(default=None, foreign_key="lead.id")
@@ -334,6 +339,13 @@ class LeadEvent(SQLModel, table=True):
     Customer Portal only shows: OUTBOUND_SENT (and ENRICHED_NO_OUTBOUND in REVIEW mode)
     Admin Console shows all states for debugging.
     """
+    __table_args__ = (
+        # Portal/admin top-N reads: filter by status or owner, newest most-urgent first
+        Index("ix_leadevent_status_urgency_created", "enrichment_status", "urgency_score", "created_at"),
+        Index("ix_leadevent_company_urgency_created", "company_id", "urgency_score", "created_at"),
+        Index("ix_leadevent_created_at", "created_at"),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     company_id: Optional[int] = Field(default=None, foreign_key="customer.id")  # Customer who owns this lead
     lead_id: Optional[int] = Field(default=None, foreign_key="lead.id")
@@ -31,6 +31,10 @@ When DRY_RUN is enabled:
   - Mock/sample signals are generated for testing
   - Useful for development and testing without hitting rate limits
 
+Environment variable SIGNAL_LOG_VERBOSE (default false) additionally logs a
+"score" and "persist" entry per signal; otherwise each source logs one
+"complete" entry with its counts and score summary.
+
 ============================================================================
 ARCHITECTURE
 ============================================================================
@@ -43,7 +47,9 @@ ARCHITECTURE
        |
   score_signal()            - Scoring utility with weighted factors
        |
-  log_signal_activity()     - Structured logging for debugging
+  log_signal_activity()     - Structured logging for debugging (DB rows written
+                              by a background thread; flush_logs() waits and
+                              writes any failed rows on the caller session)
 
 ============================================================================
 ERROR HANDLING & AUTO-DISABLE
@@ -66,17 +72,27 @@ Via LEAD_GEOGRAPHY and LEAD_NICHE environment variables:
 
 import json
 import os
+import queue
 import random
-import requests
+import re
+import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Type
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from models import Signal, LeadEvent, SignalLog, Customer, BusinessProfile, ENRICHMENT_STATUS_UNENRICHED, ENRICHMENT_STATUS_ENRICHED
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 OPENWEATHER_API_KEY = os.environ.get("OPENWEATHER_API_KEY", "")
 NEWS_API_KEY = os.environ.get("NEWS_API_KEY", "")
@@ -84,6 +100,7 @@ NEWS_API_KEY = os.environ.get("NEWS_API_KEY", "")
 
 SIGNAL_MODE = os.environ.get("SIGNAL_MODE", "PRODUCTION").upper()  # Changed from SANDBOX
 SIGNAL_DRY_RUN = os.environ.get("SIGNAL_DRY_RUN", "false").lower() in ("true", "1", "yes")
+SIGNAL_LOG_VERBOSE = os.environ.get("SIGNAL_LOG_VERBOSE", "false").lower() in ("true", "1", "yes")
 LEAD_GEOGRAPHY = os.environ.get("LEAD_GEOGRAPHY", "Miami, Broward, South Florida")
 LEAD_NICHE = os.environ.get("LEAD_NICHE", "HVAC, Roofing, Med Spa, Immigration Attorney")
 
@@ -92,6 +109,22 @@ LEAD_NICHE_LIST = [n.strip().lower() for n in LEAD_NICHE.split(",")]
 
 LEADEVENT_SCORE_THRESHOLD = 60  # Changed from 65
 MAX_CONSECUTIVE_ERRORS = 5
+MAX_PIPELINE_WORKERS = 8
+
+# SIGNAL_MODE itself is reassigned at runtime (main.py mode endpoint), so
+# sources check membership on each read rather than caching the result.
+_RUN_MODES = frozenset(("SANDBOX", "PRODUCTION"))
+
+
+def _compile_keywords(keywords) -> "re.Pattern[str]":
+    """Compile keywords into one substring-matching alternation (input is pre-lowered)."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# Single-pass matchers for the lead lists: one regex alternation scans the
+# input once instead of one substring scan per configured target.
+_LEAD_GEOGRAPHY_RE = _compile_keywords(LEAD_GEOGRAPHY_LIST)
+_LEAD_NICHE_RE = _compile_keywords(LEAD_NICHE_LIST)
 
 URGENCY_CATEGORY_WEIGHTS = {
     "HURRICANE": 95,
@@ -111,6 +144,79 @@ URGENCY_CATEGORY_WEIGHTS = {
 
 _log_session: Optional[Session] = None
 
+LOG_FLUSH_BATCH_SIZE = 200
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+_LOG_QUEUE: "queue.Queue[Tuple[Any, Dict[str, Any]]]" = queue.Queue()
+_log_writer: Optional[threading.Thread] = None
+_log_writer_lock = threading.Lock()
+
+# Batches that still fail after LOG_WRITE_ATTEMPTS (e.g. SQLite "database is
+# locked") are held here until flush_logs() can write them on a caller session.
+LOG_WRITE_ATTEMPTS = 3
+LOG_WRITE_RETRY_DELAY_SECONDS = 0.5
+LOG_UNWRITTEN_MAX_ROWS = 5000
+_unwritten_log_rows: List[Tuple[Any, Dict[str, Any]]] = []
+_unwritten_log_lock = threading.Lock()
+
+_http_sessions: Dict[Tuple[int, ...], Any] = {}
+_http_session_lock = threading.Lock()
+
+
+def _json_default(value: Any) -> str:
+    """json.dumps fallback for non-JSON types, matching orjson's output."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps_payload(data: Any) -> str:
+    """
+    Serialize a raw signal payload to JSON text (orjson when installed).
+    
+    The json fallback uses orjson's compact, non-ASCII-escaping format so
+    stored payloads and log details are identical either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=_json_default, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads_json(content: bytes) -> Any:
+    """Decode JSON text or a response body (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def get_http_session(retry_statuses: Tuple[int, ...] = (502, 503, 504)):
+    """
+    Module-wide keep-alive requests.Session, created on first use.
+    
+    Pooled (16 connections per host) so concurrent source fetches reuse
+    connections, with a small retry policy for transient errors. One session
+    is kept per retry_statuses tuple, so sources that also retry e.g. 429s
+    share a pool with each other rather than building their own.
+    """
+    session = _http_sessions.get(retry_statuses)
+    if session is None:
+        with _http_session_lock:
+            session = _http_sessions.get(retry_statuses)
+            if session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=16,
+                    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=retry_statuses),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_sessions[retry_statuses] = session
+    return session
+
 
 def _get_dry_run_prefix() -> str:
     """Get log prefix for dry run mode."""
@@ -138,33 +244,163 @@ def log_signal_activity(
         error: Error message (if any)
         session: Optional database session for persistence
     """
+    row = _render_log_entry(source_name, action, details, signal_count, error)
+    
+    if session:
+        try:
+            _enqueue_log_entry(session.get_bind(), row)
+        except Exception as e:
+            print(f"[SIGNALNET][LOG] Failed to persist log entry: {e}")
+
+
+def log_signal_activity_batch(
+    entries: List[Dict[str, Any]],
+    session: Optional[Session] = None
+) -> None:
+    """
+    Log several signal activity entries at once.
+    
+    Each entry holds log_signal_activity keyword arguments (source_name,
+    action, details, signal_count, error). Console lines are printed in order
+    and the rows are queued back to back so the writer persists them together.
+    """
+    rows = [_render_log_entry(**entry) for entry in entries]
+    
+    if session and rows:
+        try:
+            bind = session.get_bind()
+            for row in rows:
+                _enqueue_log_entry(bind, row)
+        except Exception as e:
+            print(f"[SIGNALNET][LOG] Failed to persist {len(rows)} log entries: {e}")
+
+
+def _render_log_entry(
+    source_name: str,
+    action: str,
+    details: Optional[Dict] = None,
+    signal_count: int = 0,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """Print one activity line to the console and return its SignalLog row."""
     prefix = _get_dry_run_prefix()
-    timestamp = datetime.utcnow().isoformat()
     
-    details_str = json.dumps(details) if details else "{}"
+    details_str = _dumps_payload(details) if details else "{}"
     
-    log_level = "ERROR" if error else "INFO"
     error_part = f" | Error: {error}" if error else ""
     count_part = f" | Count: {signal_count}" if signal_count > 0 else ""
     
     console_msg = f"{prefix}[SIGNALNET][{source_name.upper()}][{action.upper()}] {details_str[:200]}{count_part}{error_part}"
     print(console_msg)
     
-    if session:
+    now = datetime.utcnow()
+    return {
+        "timestamp": now,
+        "source_name": source_name,
+        "action": action,
+        "details": details_str,
+        "signal_count": signal_count,
+        "error_message": error,
+        "dry_run": SIGNAL_DRY_RUN,
+        "created_at": now,
+    }
+
+
+def _enqueue_log_entry(bind: Any, row: Dict[str, Any]) -> None:
+    """Queue a SignalLog row for the background writer, starting it if needed."""
+    global _log_writer
+    if _log_writer is None:
+        with _log_writer_lock:
+            if _log_writer is None:
+                _log_writer = threading.Thread(target=_log_drain, name="signalnet-log-writer", daemon=True)
+                _log_writer.start()
+    _LOG_QUEUE.put_nowait((bind, row))
+
+
+def _log_drain() -> None:
+    """
+    Background writer for SignalLog rows.
+    
+    Blocks for the first queued row, then drains up to LOG_FLUSH_BATCH_SIZE
+    more without waiting and writes them with one bulk insert per engine.
+    """
+    while True:
         try:
-            log_entry = SignalLog(
-                timestamp=datetime.utcnow(),
-                source_name=source_name,
-                action=action,
-                details=details_str,
-                signal_count=signal_count,
-                error_message=error,
-                dry_run=SIGNAL_DRY_RUN,
-            )
-            session.add(log_entry)
-            session.commit()
-        except Exception as e:
-            print(f"[SIGNALNET][LOG] Failed to persist log entry: {e}")
+            batch = [_LOG_QUEUE.get(timeout=LOG_FLUSH_INTERVAL_SECONDS)]
+        except queue.Empty:
+            continue
+        while len(batch) < LOG_FLUSH_BATCH_SIZE:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_log_batch(batch)
+        finally:
+            for _ in batch:
+                _LOG_QUEUE.task_done()
+
+
+def _write_log_batch(batch: List[Tuple[Any, Dict[str, Any]]]) -> None:
+    """
+    Persist a batch of queued log rows, one transaction per engine.
+    
+    Each engine's rows are retried up to LOG_WRITE_ATTEMPTS times; rows that
+    still fail are held for flush_logs() instead of being dropped.
+    """
+    rows_by_bind: Dict[Any, List[Dict[str, Any]]] = {}
+    for bind, row in batch:
+        rows_by_bind.setdefault(bind, []).append(row)
+    
+    for bind, rows in rows_by_bind.items():
+        for attempt in range(1, LOG_WRITE_ATTEMPTS + 1):
+            try:
+                with Session(bind) as session:
+                    session.bulk_insert_mappings(SignalLog, rows)
+                    session.commit()
+                break
+            except Exception as e:
+                if attempt < LOG_WRITE_ATTEMPTS:
+                    time.sleep(LOG_WRITE_RETRY_DELAY_SECONDS * attempt)
+                    continue
+                print(f"[SIGNALNET][LOG] Failed to persist {len(rows)} log entries after {attempt} attempts, holding for flush_logs(): {e}")
+                with _unwritten_log_lock:
+                    _unwritten_log_rows.extend((bind, row) for row in rows)
+                    overflow = len(_unwritten_log_rows) - LOG_UNWRITTEN_MAX_ROWS
+                    if overflow > 0:
+                        del _unwritten_log_rows[:overflow]
+                        print(f"[SIGNALNET][LOG] Dropped {overflow} oldest unwritten log entries (limit {LOG_UNWRITTEN_MAX_ROWS})")
+
+
+def flush_logs(session: Optional[Session] = None) -> int:
+    """
+    Block until every queued SignalLog row has been handled.
+    
+    Rows the background writer could not persist are written on session
+    (when given, for its engine) and committed. Returns the number of rows
+    still unwritten, so 0 means every log entry reached the database.
+    """
+    if _log_writer is not None:
+        _LOG_QUEUE.join()
+    
+    with _unwritten_log_lock:
+        if session is not None and _unwritten_log_rows:
+            bind = session.get_bind()
+            rows = [row for row_bind, row in _unwritten_log_rows if row_bind is bind]
+            if rows:
+                try:
+                    with session.begin_nested():
+                        session.bulk_insert_mappings(SignalLog, rows)
+                    session.commit()
+                    _unwritten_log_rows[:] = [item for item in _unwritten_log_rows if item[0] is not bind]
+                    print(f"[SIGNALNET][LOG] Persisted {len(rows)} held log entries on the caller session")
+                except Exception as e:
+                    print(f"[SIGNALNET][LOG] Failed to persist {len(rows)} held log entries on the caller session: {e}")
+        unwritten = len(_unwritten_log_rows)
+    
+    if unwritten:
+        print(f"[SIGNALNET][LOG] WARNING: {unwritten} log entries not persisted")
+    return unwritten
 
 
 def set_log_session(session: Optional[Session]) -> None:
@@ -181,7 +417,7 @@ def get_log_session() -> Optional[Session]:
 print(f"{_get_dry_run_prefix()}[SIGNALNET][STARTUP] Mode: {SIGNAL_MODE} (default: PRODUCTION), Threshold: {LEADEVENT_SCORE_THRESHOLD}, DRY_RUN: {SIGNAL_DRY_RUN}, Geography: {LEAD_GEOGRAPHY}, Niche: {LEAD_NICHE}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RawSignal:
     """
     Raw signal data fetched from a source before parsing.
@@ -199,7 +435,7 @@ class RawSignal:
     company_id_hint: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedSignal:
     """
     Parsed signal ready for scoring and persistence.
@@ -215,9 +451,17 @@ class ParsedSignal:
     category_hint: Optional[str] = None
     niche_hint: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
+    extracted_contact_info: Optional[Dict[str, Any]] = None
+    # Derived from created_at (naive UTC) so recency scoring is float arithmetic
+    created_at_epoch: float = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(
+            self, "created_at_epoch", self.created_at.replace(tzinfo=timezone.utc).timestamp()
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoredSignal:
     """
     Signal with computed score and explanation.
@@ -228,6 +472,22 @@ class ScoredSignal:
     should_create_event: bool
 
 
+@dataclass(slots=True)
+class SourceResult:
+    """
+    Per-source outcome of a pipeline run (one entry of results["sources_run"]).
+    """
+    source: str
+    source_type: str
+    dry_run: bool
+    fetched: int = 0
+    parsed: int = 0
+    scored: int = 0
+    persisted: int = 0
+    events_created: int = 0
+    error: Optional[str] = None
+
+
 class SignalSource(ABC):
     """
     Abstract base class for signal sources.
@@ -237,6 +497,7 @@ class SignalSource(ABC):
     contact data - HossNative handles lead discovery via autonomous web scraping.
     
     Subclasses must implement:
+      - name: Unique source name, as a class attribute
       - fetch() -> List[RawSignal]: Get raw signals from the source
       - parse(raw: RawSignal) -> ParsedSignal: Convert raw to parsed format
     
@@ -262,38 +523,48 @@ class SignalSource(ABC):
     def __init__(self):
         self._last_run: Optional[datetime] = None
         self._next_eligible: Optional[datetime] = None
+        self._last_run_iso: Optional[str] = None
+        self._next_eligible_iso: Optional[str] = None
         self._last_error: Optional[str] = None
         self._items_last_run: int = 0
         self._error_count: int = 0
         self._auto_disabled: bool = False
         self._disabled_reason: Optional[str] = None
+        self._http = None
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Unique name for this source (e.g., 'google_reviews', 'indeed_jobs')."""
-        ...
+    # HTTP statuses the shared session retries for this source
+    HTTP_RETRY_STATUSES: Tuple[int, ...] = (502, 503, 504)
     
-    @property
-    @abstractmethod
-    def source_type(self) -> str:
-        """Category of signals this source provides (e.g., 'review', 'job_posting')."""
-        ...
+    def _http_session(self):
+        """HTTP session for this source's requests (shared pool, see get_http_session)."""
+        if self._http is None:
+            self._http = get_http_session(self.HTTP_RETRY_STATUSES)
+        return self._http
     
-    @property
-    def enabled(self) -> bool:
+    # Source metadata lives on the class so the registry can check and report
+    # it before a source is instantiated.
+    
+    # Unique name for this source (e.g., 'google_reviews', 'indeed_jobs')
+    name: str
+    
+    # Category of signals this source provides (e.g., 'review', 'job_posting')
+    source_type: str
+    
+    # Minimum seconds between runs. Override for source-specific cooldowns.
+    cooldown_seconds: int = 300
+    
+    # Maximum signals to fetch per run. Override for rate limiting.
+    max_items_per_run: int = 50
+    
+    @classmethod
+    def is_class_enabled(cls) -> bool:
         """Whether this source is active. Override to add conditional logic."""
         return True
     
     @property
-    def cooldown_seconds(self) -> int:
-        """Minimum seconds between runs. Override for source-specific cooldowns."""
-        return 300
-    
-    @property
-    def max_items_per_run(self) -> int:
-        """Maximum signals to fetch per run. Override for rate limiting."""
-        return 50
+    def enabled(self) -> bool:
+        """Whether this source is active (see is_class_enabled)."""
+        return self.is_class_enabled()
     
     @property
     def last_run(self) -> Optional[datetime]:
@@ -360,6 +631,8 @@ class SignalSource(ABC):
         """Record the results of a run and update error tracking."""
         self._last_run = datetime.utcnow()
         self._next_eligible = self._last_run + timedelta(seconds=self.cooldown_seconds)
+        self._last_run_iso = self._last_run.isoformat()
+        self._next_eligible_iso = self._next_eligible.isoformat()
         self._items_last_run = items_count
         self._last_error = error
         
@@ -470,6 +743,27 @@ class SignalSource(ABC):
         """
         ...
     
+    @classmethod
+    def get_class_status(cls) -> Dict[str, Any]:
+        """Status of a source that has not been instantiated (so has never run)."""
+        enabled = cls.is_class_enabled()
+        return {
+            "name": cls.name,
+            "source_type": cls.source_type,
+            "enabled": enabled,
+            "cooldown_seconds": cls.cooldown_seconds,
+            "max_items_per_run": cls.max_items_per_run,
+            "last_run": None,
+            "next_eligible": None,
+            "last_error": None,
+            "items_last_run": 0,
+            "error_count": 0,
+            "is_auto_disabled": False,
+            "disabled_reason": None,
+            "is_eligible": enabled,
+            "dry_run": SIGNAL_DRY_RUN,
+        }
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current status of this source."""
         return {
@@ -478,8 +772,8 @@ class SignalSource(ABC):
             "enabled": self.enabled,
             "cooldown_seconds": self.cooldown_seconds,
             "max_items_per_run": self.max_items_per_run,
-            "last_run": self._last_run.isoformat() if self._last_run else None,
-            "next_eligible": self._next_eligible.isoformat() if self._next_eligible else None,
+            "last_run": self._last_run_iso,
+            "next_eligible": self._next_eligible_iso,
             "last_error": self._last_error,
             "items_last_run": self._items_last_run,
             "error_count": self._error_count,
@@ -499,8 +793,8 @@ class SignalSource(ABC):
         
         return {
             "name": self.name,
-            "last_run": self._last_run.isoformat() if self._last_run else None,
-            "next_eligible": self._next_eligible.isoformat() if self._next_eligible else None,
+            "last_run": self._last_run_iso,
+            "next_eligible": self._next_eligible_iso,
             "seconds_until_eligible": time_until_eligible,
             "error_count": self._error_count,
             "max_errors_before_disable": MAX_CONSECUTIVE_ERRORS,
@@ -522,17 +816,23 @@ class SignalRegistry:
     def __init__(self):
         self._sources: Dict[str, SignalSource] = {}
         self._source_classes: Dict[str, Type[SignalSource]] = {}
+        self._generation: int = 0
+        self._eligible_snapshot: Optional[Tuple[Tuple[int, int], List[SignalSource]]] = None
     
     def register_class(self, source_class: Type[SignalSource]) -> None:
         """
         Register a SignalSource class for lazy instantiation.
         
+        The class is not instantiated here; its name is read from the class
+        attribute and an instance is only built once the source is eligible.
+        
         Args:
             source_class: A SignalSource subclass (not an instance)
         """
-        temp_instance = source_class()
-        self._source_classes[temp_instance.name] = source_class
-        print(f"[SIGNALNET][REGISTRY] Registered source class: {temp_instance.name}")
+        name = source_class.name
+        self._source_classes[name] = source_class
+        self._generation += 1
+        print(f"[SIGNALNET][REGISTRY] Registered source class: {name}")
     
     def register(self, source: SignalSource) -> None:
         """
@@ -542,6 +842,7 @@ class SignalRegistry:
             source: A SignalSource instance
         """
         self._sources[source.name] = source
+        self._generation += 1
         print(f"[SIGNALNET][REGISTRY] Registered source: {source.name} ({source.source_type})")
     
     def unregister(self, name: str) -> bool:
@@ -556,10 +857,12 @@ class SignalRegistry:
         """
         if name in self._sources:
             del self._sources[name]
+            self._generation += 1
             print(f"[SIGNALNET][REGISTRY] Unregistered source: {name}")
             return True
         if name in self._source_classes:
             del self._source_classes[name]
+            self._generation += 1
             return True
         return False
     
@@ -579,6 +882,14 @@ class SignalRegistry:
                 self._sources[name] = cls()
         return list(self._sources.values())
     
+    def get_source_count(self) -> int:
+        """Get the number of registered sources without instantiating them."""
+        return len(self._sources.keys() | self._source_classes.keys())
+    
+    def mark_run(self, name: str) -> None:
+        """Record that a source ran, so the next eligibility check is recomputed."""
+        self._generation += 1
+    
     def get_eligible_sources(self) -> List[SignalSource]:
         """
         Get sources eligible to run in the current cycle.
@@ -586,43 +897,71 @@ class SignalRegistry:
         Returns sources that:
           - Are enabled
           - Have passed their cooldown period
+        
+        Registered classes are only instantiated once they are enabled; a
+        class that was never instantiated has never run, so it has no
+        cooldown to wait out.
+        
+        Results are cached per wall-clock second and registry generation
+        (bumped on register/unregister/run); cooldowns are >= 300s so the
+        snapshot is at most one second stale.
         """
-        all_sources = self.get_all_sources()
-        eligible = [s for s in all_sources if s.is_eligible()]
+        snapshot_key = (int(time.monotonic()), self._generation)
+        if self._eligible_snapshot and self._eligible_snapshot[0] == snapshot_key:
+            return list(self._eligible_snapshot[1])
+        
+        for name, cls in self._source_classes.items():
+            if name not in self._sources and cls.is_class_enabled():
+                self._sources[name] = cls()
         
-        print(f"[SIGNALNET][REGISTRY] {len(eligible)}/{len(all_sources)} sources eligible")
-        return eligible
+        eligible = [s for s in self._sources.values() if s.is_eligible()]
+        self._eligible_snapshot = (snapshot_key, eligible)
+        
+        print(f"[SIGNALNET][REGISTRY] {len(eligible)}/{self.get_source_count()} sources eligible")
+        return list(eligible)
     
     def get_status(self) -> Dict[str, Any]:
-        """Get status of all registered sources."""
-        all_sources = self.get_all_sources()
+        """
+        Get status of all registered sources.
+        
+        Classes that have not been instantiated report from class-level
+        metadata, so a status read doesn't build every source.
+        """
+        sources = [source.get_status() for source in self._sources.values()]
+        sources.extend(
+            cls.get_class_status()
+            for name, cls in self._source_classes.items()
+            if name not in self._sources
+        )
         return {
-            "total_sources": len(all_sources),
-            "eligible_sources": len([s for s in all_sources if s.is_eligible()]),
-            "sources": [s.get_status() for s in all_sources],
+            "total_sources": len(sources),
+            "eligible_sources": len([s for s in sources if s["is_eligible"]]),
+            "sources": sources,
         }
 
 
+@lru_cache(maxsize=1024)
 def _matches_lead_geography(geography: Optional[str]) -> bool:
     """Check if geography matches configured LEAD_GEOGRAPHY."""
     if not geography:
         return False
-    geo_lower = geography.lower()
-    return any(target in geo_lower for target in LEAD_GEOGRAPHY_LIST)
+    return _LEAD_GEOGRAPHY_RE.search(geography.lower()) is not None
 
 
+@lru_cache(maxsize=1024)
 def _matches_lead_niche(niche: Optional[str]) -> bool:
     """Check if niche matches configured LEAD_NICHE."""
     if not niche:
         return False
-    niche_lower = niche.lower()
-    return any(target in niche_lower for target in LEAD_NICHE_LIST)
+    return _LEAD_NICHE_RE.search(niche.lower()) is not None
 
 
-def _calculate_recency_score(created_at: datetime, max_age_hours: int = 72) -> int:
+def _calculate_recency_score(created_at_epoch: float, now_epoch: float, max_age_hours: int = 72) -> int:
     """
     Calculate recency score (0-100) based on signal age.
     
+    Takes Unix timestamps so scoring is plain float arithmetic.
+    
     Newer signals score higher:
       - 0-6 hours: 100
       - 6-24 hours: 80-99
@@ -630,8 +969,7 @@ def _calculate_recency_score(created_at: datetime, max_age_hours: int = 72) -> i
       - 48-72 hours: 40-59
       - 72+ hours: 20-39
     """
-    now = datetime.utcnow()
-    age_hours = (now - created_at).total_seconds() / 3600
+    age_hours = (now_epoch - created_at_epoch) * (1 / 3600)
     
     if age_hours <= 6:
         return 100
@@ -696,9 +1034,10 @@ def score_signal(
     category_score = int(category_base * 0.30)
     explanation_parts.append(f"Category {category}: {category_base}×0.30 = {category_score}")
     
-    recency_base = _calculate_recency_score(parsed_signal.created_at)
+    now_epoch = time.time()
+    recency_base = _calculate_recency_score(parsed_signal.created_at_epoch, now_epoch)
     recency_score = int(recency_base * 0.25)
-    age_hours = (datetime.utcnow() - parsed_signal.created_at).total_seconds() / 3600
+    age_hours = (now_epoch - parsed_signal.created_at_epoch) * (1 / 3600)
     explanation_parts.append(f"Recency ({age_hours:.1f}h old): {recency_base}×0.25 = {recency_score}")
     
     geo_match = _matches_lead_geography(parsed_signal.geography)
@@ -772,18 +1111,21 @@ def _infer_category(source_type: str, context: str) -> str:
         return "OPPORTUNITY"
 
 
+_RECOMMENDED_ACTIONS = {
+    "HURRICANE_SEASON": "Offer hurricane-season discount bundle or preparedness package",
+    "COMPETITOR_SHIFT": "Send competitive analysis snapshot highlighting your differentiators",
+    "GROWTH_SIGNAL": "Propose partnership or capacity-building services",
+    "BILINGUAL_OPPORTUNITY": "Highlight bilingual staff on homepage - big ROI in Miami market",
+    "REPUTATION_CHANGE": "Offer reputation management or customer experience audit",
+    "MIAMI_PRICE_MOVE": "Prepare market pricing comparison and value proposition",
+    "OPPORTUNITY": "Send contextual outreach with relevant service offer",
+}
+_DEFAULT_ACTION = "Prepare contextual outreach based on signal"
+
+
 def _generate_recommended_action(category: str, context: str) -> str:
     """Generate recommended action based on category."""
-    actions = {
-        "HURRICANE_SEASON": "Offer hurricane-season discount bundle or preparedness package",
-        "COMPETITOR_SHIFT": "Send competitive analysis snapshot highlighting your differentiators",
-        "GROWTH_SIGNAL": "Propose partnership or capacity-building services",
-        "BILINGUAL_OPPORTUNITY": "Highlight bilingual staff on homepage - big ROI in Miami market",
-        "REPUTATION_CHANGE": "Offer reputation management or customer experience audit",
-        "MIAMI_PRICE_MOVE": "Prepare market pricing comparison and value proposition",
-        "OPPORTUNITY": "Send contextual outreach with relevant service offer",
-    }
-    return actions.get(category.upper(), "Prepare contextual outreach based on signal")
+    return _RECOMMENDED_ACTIONS.get(category.upper(), _DEFAULT_ACTION)
 
 
 def _extract_company_from_context(context_summary: str) -> Optional[str]:
@@ -898,6 +1240,26 @@ def _extract_company_from_context(context_summary: str) -> Optional[str]:
     return None
 
 
+_AGGREGATOR_DOMAINS = (
+    "news.google.com", "google.com", "yahoo.com", "msn.com", 
+    "flipboard.com", "feedly.com", "apple.news", "smartnews.com"
+)
+
+_PUBLISHER_TO_DOMAIN = {
+    "miami herald": "miamiherald.com",
+    "sun sentinel": "sun-sentinel.com",
+    "south florida business journal": "bizjournals.com/southflorida",
+    "local 10": "local10.com",
+    "wsvn": "wsvn.com",
+    "nbc 6": "nbcmiami.com",
+    "palm beach post": "palmbeachpost.com",
+    "openpr": "openpr.com",
+    "pr newswire": "prnewswire.com",
+    "business wire": "businesswire.com",
+    "globenewswire": "globenewswire.com",
+}
+
+
 def _extract_domain_from_context(context_summary: str, raw_payload: str) -> Optional[str]:
     """
     Extract domain from signal context or raw payload.
@@ -912,31 +1274,12 @@ def _extract_domain_from_context(context_summary: str, raw_payload: str) -> Opti
     import re
     import json
     
-    AGGREGATOR_DOMAINS = [
-        "news.google.com", "google.com", "yahoo.com", "msn.com", 
-        "flipboard.com", "feedly.com", "apple.news", "smartnews.com"
-    ]
-    
-    PUBLISHER_TO_DOMAIN = {
-        "miami herald": "miamiherald.com",
-        "sun sentinel": "sun-sentinel.com",
-        "south florida business journal": "bizjournals.com/southflorida",
-        "local 10": "local10.com",
-        "wsvn": "wsvn.com",
-        "nbc 6": "nbcmiami.com",
-        "palm beach post": "palmbeachpost.com",
-        "openpr": "openpr.com",
-        "pr newswire": "prnewswire.com",
-        "business wire": "businesswire.com",
-        "globenewswire": "globenewswire.com",
-    }
-    
     if raw_payload:
         try:
-            data = json.loads(raw_payload)
+            data = _loads_json(raw_payload)
             
             source = data.get("source", "").lower()
-            for publisher, domain in PUBLISHER_TO_DOMAIN.items():
+            for publisher, domain in _PUBLISHER_TO_DOMAIN.items():
                 if publisher in source:
                     return domain
             
@@ -945,7 +1288,7 @@ def _extract_domain_from_context(context_summary: str, raw_payload: str) -> Opti
                 url_match = re.search(r'https?://(?:www\.)?([a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+)', link)
                 if url_match:
                     domain = url_match.group(1)
-                    if not any(agg in domain for agg in AGGREGATOR_DOMAINS):
+                    if not any(agg in domain for agg in _AGGREGATOR_DOMAINS):
                         return domain
         except (json.JSONDecodeError, TypeError):
             pass
@@ -960,13 +1303,13 @@ def _extract_domain_from_context(context_summary: str, raw_payload: str) -> Opti
         url_match = re.search(url_pattern, text)
         if url_match:
             domain = url_match.group(1)
-            if not any(agg in domain for agg in AGGREGATOR_DOMAINS):
+            if not any(agg in domain for agg in _AGGREGATOR_DOMAINS):
                 return domain
         
         domain_match = re.search(domain_pattern, text.lower())
         if domain_match:
             domain = domain_match.group(1)
-            if not any(agg in domain for agg in AGGREGATOR_DOMAINS):
+            if not any(agg in domain for agg in _AGGREGATOR_DOMAINS):
                 return domain
     
     return None
@@ -1063,10 +1406,33 @@ def _get_primary_customer(session: Session) -> Optional[int]:
     return None
 
 
+def _get_existing_event_ids_by_summary(
+    session: Session,
+    summaries: List[str]
+) -> Dict[Tuple[Optional[int], str], int]:
+    """
+    Batch-load existing LeadEvents matching any of the given summaries.
+    
+    Replaces one duplicate-check query per candidate signal with a single
+    SELECT. Returns {(company_id, summary): event_id}.
+    """
+    if not summaries:
+        return {}
+    
+    rows = session.exec(
+        select(LeadEvent.company_id, LeadEvent.summary, LeadEvent.id)
+        .where(LeadEvent.summary.in_(set(summaries)))
+    ).all()
+    return {(company_id, summary): event_id for company_id, summary, event_id in rows}
+
+
 def create_lead_event_from_signal(
     scored_signal: ScoredSignal,
     session: Session,
-    signal: Optional[Signal] = None
+    signal: Optional[Signal] = None,
+    existing_events: Optional[Dict[Tuple[Optional[int], str], int]] = None,
+    commit: bool = True,
+    signal_id: Optional[int] = None
 ) -> Optional[LeadEvent]:
     """
     Create a LeadEvent from a high-scoring signal.
@@ -1082,21 +1448,61 @@ def create_lead_event_from_signal(
         scored_signal: The scored signal containing parsed data and score
         session: Database session for persistence
         signal: Optional persisted Signal object (if already created)
+        existing_events: Optional prefetched {(company_id, summary): event_id}
+            map from _get_existing_event_ids_by_summary(); when given, it is
+            used for the same-summary duplicate check instead of a query and
+            is updated with the newly created event
+        commit: If False, the event is only flushed (to assign its id) and
+            the caller is responsible for committing the batch
+        signal_id: Id of the persisted signal, for callers that inserted it
+            without loading a Signal object (takes precedence over signal)
         
     Returns:
         LeadEvent if created successfully, None if duplicate or error
     """
+    if signal_id is None and signal:
+        signal_id = signal.id
+    
+    event = _build_lead_event(scored_signal, session, signal_id, existing_events)
+    if event is None:
+        return None
+    
+    session.add(event)
+    session.flush()
+    # Log before committing: reading attributes after commit would reload them
+    _log_lead_event_created(event, scored_signal.score, existing_events, session)
+    if commit:
+        session.commit()
+    
+    return event
+
+
+def _build_lead_event(
+    scored_signal: ScoredSignal,
+    session: Session,
+    signal_id: Optional[int],
+    existing_events: Optional[Dict[Tuple[Optional[int], str], int]],
+    check_signal_duplicate: bool = True
+) -> Optional[LeadEvent]:
+    """
+    Build (but do not add) the LeadEvent for a scored signal.
+    
+    Returns None, after logging the reason, if an event already exists for
+    the same signal id or the same (company, summary). Pass
+    check_signal_duplicate=False when signal_id was inserted in the current
+    transaction and so cannot have an event yet.
+    """
     parsed = scored_signal.parsed_signal
     
-    if signal and signal.id:
+    if signal_id and check_signal_duplicate:
         existing = session.exec(
-            select(LeadEvent).where(LeadEvent.signal_id == signal.id)
+            select(LeadEvent).where(LeadEvent.signal_id == signal_id)
         ).first()
         if existing:
             log_signal_activity(
                 "pipeline",
                 "skip_duplicate",
-                {"signal_id": signal.id, "existing_event_id": existing.id, "reason": "same_signal_id"},
+                {"signal_id": signal_id, "existing_event_id": existing.id, "reason": "same_signal_id"},
                 session=session
             )
             return None
@@ -1105,17 +1511,22 @@ def create_lead_event_from_signal(
     if not assigned_company_id:
         assigned_company_id = _get_primary_customer(session)
     
-    existing_by_summary = session.exec(
-        select(LeadEvent).where(
-            LeadEvent.summary == parsed.context_summary,
-            LeadEvent.company_id == assigned_company_id
-        )
-    ).first()
-    if existing_by_summary:
+    if existing_events is not None:
+        existing_event_id = existing_events.get((assigned_company_id, parsed.context_summary))
+    else:
+        existing_by_summary = session.exec(
+            select(LeadEvent).where(
+                LeadEvent.summary == parsed.context_summary,
+                LeadEvent.company_id == assigned_company_id
+            )
+        ).first()
+        existing_event_id = existing_by_summary.id if existing_by_summary else None
+    
+    if existing_event_id is not None:
         log_signal_activity(
             "pipeline",
             "skip_duplicate",
-            {"existing_event_id": existing_by_summary.id, "reason": "same_summary"},
+            {"existing_event_id": existing_event_id, "reason": "same_summary"},
             session=session
         )
         return None
@@ -1129,7 +1540,7 @@ def create_lead_event_from_signal(
     domain = _extract_domain_from_context(parsed.context_summary, parsed.raw_payload)
     
     lead_email = None
-    contact_info = getattr(parsed, 'extracted_contact_info', {}) or {}
+    contact_info = parsed.extracted_contact_info or {}
     extracted_urls = contact_info.get('extracted_urls', [])
     extracted_emails = contact_info.get('extracted_emails', [])
     
@@ -1144,10 +1555,10 @@ def create_lead_event_from_signal(
     
     recommended_action = _generate_recommended_action(category, parsed.context_summary)
     
-    event = LeadEvent(
+    return LeadEvent(
         company_id=assigned_company_id,
         lead_id=parsed.lead_id,
-        signal_id=signal.id if signal else None,
+        signal_id=signal_id,
         lead_email=lead_email,
         lead_domain=domain,
         lead_name=None,
@@ -1160,29 +1571,34 @@ def create_lead_event_from_signal(
         enrichment_status=enrichment_status,
         enriched_company_name=company_name,
     )
+
+
+def _log_lead_event_created(
+    event: LeadEvent,
+    score: int,
+    existing_events: Optional[Dict[Tuple[Optional[int], str], int]],
+    session: Session
+) -> None:
+    """Record a flushed LeadEvent in the duplicate map and the activity log."""
+    if existing_events is not None:
+        existing_events[(event.company_id, event.summary)] = event.id
     
-    session.add(event)
-    session.commit()
-    session.refresh(event)
-    
-    print(f"[SIGNALNET][LEADEVENT] Created event {event.id} from signal (score={scored_signal.score})")
+    print(f"[SIGNALNET][LEADEVENT] Created event {event.id} from signal (score={score})")
     
     log_signal_activity(
         "pipeline",
         "create_event",
         {
             "event_id": event.id,
-            "signal_id": signal.id if signal else None,
-            "category": category,
-            "urgency_score": scored_signal.score,
-            "enrichment_status": enrichment_status,
-            "company_name": company_name,
-            "domain": domain,
+            "signal_id": event.signal_id,
+            "category": event.category,
+            "urgency_score": score,
+            "enrichment_status": event.enrichment_status,
+            "company_name": event.lead_company,
+            "domain": event.lead_domain,
         },
         session=session
     )
-    
-    return event
 
 
 class SignalPipeline:
@@ -1207,7 +1623,7 @@ class SignalPipeline:
       - All operations are logged with [DRY_RUN] prefix
     
     Error handling:
-      - Each source is processed independently
+      - Each source is processed independently (concurrently, one session per worker)
       - Sources with > 5 consecutive errors are auto-disabled
       - Structured logging captures all actions for debugging
     """
@@ -1264,42 +1680,57 @@ class SignalPipeline:
                 "mode": self.mode,
                 "dry_run": self.dry_run,
                 "skipped": False,
-                "sources_checked": len(self.registry.get_all_sources()),
+                "sources_checked": self.registry.get_source_count(),
                 "sources_eligible": 0,
                 "signals_fetched": 0,
                 "signals_persisted": 0,
                 "events_created": 0,
             }
         
+        # Sources spend most of their time in network fetches, so only the
+        # fetches run concurrently. Parsing, persistence and event creation
+        # then run serially on the caller's session, which keeps all writes in
+        # one transaction (SQLite would otherwise lock out worker sessions
+        # while the caller holds uncommitted writes).
+        with ThreadPoolExecutor(max_workers=min(MAX_PIPELINE_WORKERS, len(eligible_sources))) as executor:
+            pending_fetches = [executor.submit(self._fetch_source, source) for source in eligible_sources]
+            source_results = [
+                self._run_source(source, pending_fetch)
+                for source, pending_fetch in zip(eligible_sources, pending_fetches)
+            ]
+        
+        sources_run = []
+        errors = []
+        fetched = parsed = scored = persisted = events_created = 0
+        for source_result in source_results:
+            self.registry.mark_run(source_result.source)
+            sources_run.append(asdict(source_result))
+            fetched += source_result.fetched
+            parsed += source_result.parsed
+            scored += source_result.scored
+            persisted += source_result.persisted
+            events_created += source_result.events_created
+            if source_result.error:
+                errors.append({
+                    "source": source_result.source,
+                    "error": source_result.error,
+                })
+        
         results = {
             "mode": self.mode,
             "dry_run": self.dry_run,
             "skipped": False,
-            "sources_checked": len(self.registry.get_all_sources()),
+            "sources_checked": self.registry.get_source_count(),
             "sources_eligible": len(eligible_sources),
-            "sources_run": [],
-            "signals_fetched": 0,
-            "signals_parsed": 0,
-            "signals_scored": 0,
-            "signals_persisted": 0,
-            "events_created": 0,
-            "errors": [],
+            "sources_run": sources_run,
+            "signals_fetched": fetched,
+            "signals_parsed": parsed,
+            "signals_scored": scored,
+            "signals_persisted": persisted,
+            "events_created": events_created,
+            "errors": errors,
         }
         
-        for source in eligible_sources:
-            source_result = self._run_source(source)
-            results["sources_run"].append(source_result)
-            results["signals_fetched"] += source_result.get("fetched", 0)
-            results["signals_parsed"] += source_result.get("parsed", 0)
-            results["signals_scored"] += source_result.get("scored", 0)
-            results["signals_persisted"] += source_result.get("persisted", 0)
-            results["events_created"] += source_result.get("events_created", 0)
-            if source_result.get("error"):
-                results["errors"].append({
-                    "source": source.name,
-                    "error": source_result["error"],
-                })
-        
         log_signal_activity(
             "pipeline",
             "complete",
@@ -1311,207 +1742,319 @@ class SignalPipeline:
             signal_count=results["signals_persisted"],
             session=self.session
         )
+        flush_logs(self.session)
         
         return results
     
-    def _run_source(self, source: SignalSource) -> Dict[str, Any]:
-        """Run a single source through the pipeline with structured logging."""
-        result = {
-            "source": source.name,
-            "source_type": source.source_type,
-            "dry_run": source.is_dry_run,
-            "fetched": 0,
-            "parsed": 0,
-            "scored": 0,
-            "persisted": 0,
-            "events_created": 0,
-            "error": None,
-        }
+    def _fetch_source(self, source: SignalSource) -> List[RawSignal]:
+        """Fetch raw signals for a source. Safe to call from worker threads (no DB access)."""
+        log_signal_activity(
+            source.name,
+            "fetch",
+            {"source_type": source.source_type, "dry_run": source.is_dry_run},
+            session=self.session
+        )
+        return source.fetch_with_dry_run()
+    
+    def _run_source(self, source: SignalSource, pending_fetch: Optional["Future[List[RawSignal]]"] = None) -> SourceResult:
+        """
+        Run a single source through the pipeline with structured logging.
         
-        primary_customer = self.session.exec(select(Customer).where(Customer.id == 1)).first()
+        pending_fetch is a fetch already started by run(); without it the
+        source is fetched inline. Fetch errors are re-raised by result() and
+        handled below like inline ones.
+        """
+        import requests
+        
+        session = self.session
+        source_name = source.name
+        source_type = source.source_type
+        dry_run = source.is_dry_run
+        max_items = source.max_items_per_run
+        mode = self.mode
+        threshold = LEADEVENT_SCORE_THRESHOLD
+        result = SourceResult(source=source_name, source_type=source_type, dry_run=dry_run)
+        
+        primary_customer = session.exec(select(Customer).where(Customer.id == 1)).first()
         bypass_niche_filter = primary_customer is not None
         
         try:
-            log_signal_activity(
-                source.name,
-                "fetch",
-                {"source_type": source.source_type, "dry_run": source.is_dry_run},
-                session=self.session
-            )
-            
-            raw_signals = source.fetch_with_dry_run()
-            result["fetched"] = len(raw_signals)
+            if pending_fetch is not None:
+                raw_signals = pending_fetch.result()
+            else:
+                raw_signals = self._fetch_source(source)
+            result.fetched = len(raw_signals)
             
-            if len(raw_signals) > source.max_items_per_run:
-                raw_signals = raw_signals[:source.max_items_per_run]
+            if len(raw_signals) > max_items:
+                raw_signals = raw_signals[:max_items]
                 log_signal_activity(
-                    source.name,
+                    source_name,
                     "throttle",
-                    {"capped_at": source.max_items_per_run, "original": result["fetched"]},
-                    session=self.session
+                    {"capped_at": max_items, "original": result.fetched},
+                    session=session
                 )
             
+            scored_signals: List[ScoredSignal] = []
+            
             for raw_signal in raw_signals:
                 try:
                     parsed = source.parse(raw_signal)
-                    result["parsed"] += 1
+                    result.parsed += 1
                     
                     scored = score_signal(parsed, bypass_niche_filter=bypass_niche_filter)
-                    result["scored"] += 1
-                    
-                    log_signal_activity(
-                        source.name,
-                        "score",
-                        {"score": scored.score, "should_create_event": scored.should_create_event},
-                        session=self.session
-                    )
+                    result.scored += 1
                     
-                    signal = self._persist_signal(parsed, source.name)
-                    result["persisted"] += 1
-                    
-                    if scored.score >= LEADEVENT_SCORE_THRESHOLD and self.mode == "PRODUCTION":
-                        is_self, self_reason = is_self_signal(parsed, self.session)
-                        if is_self:
-                            log_signal_activity(
-                                source.name,
-                                "skip_self_signal",
-                                {"score": scored.score, "reason": self_reason},
-                                session=self.session
-                            )
-                            print(f"[SIGNALNET][SELF_SIGNAL] Skipping: {self_reason}")
-                            continue
-                        
-                        lead_event = create_lead_event_from_signal(scored, self.session, signal)
-                        if lead_event:
-                            result["events_created"] += 1
-                    elif scored.score >= LEADEVENT_SCORE_THRESHOLD and self.mode == "SANDBOX":
+                    if SIGNAL_LOG_VERBOSE:
                         log_signal_activity(
-                            source.name,
-                            "sandbox_skip_event",
-                            {"score": scored.score, "threshold": LEADEVENT_SCORE_THRESHOLD, "reason": "SANDBOX mode"},
-                            session=self.session
+                            source_name,
+                            "score",
+                            {"score": scored.score, "should_create_event": scored.should_create_event},
+                            session=session
                         )
                     
+                    scored_signals.append(scored)
+                    
                 except ValueError as ve:
                     log_signal_activity(
-                        source.name,
+                        source_name,
                         "error",
                         {"stage": "parse", "error_type": "ValueError"},
                         error=str(ve),
-                        session=self.session
+                        session=session
                     )
                 except TypeError as te:
                     log_signal_activity(
-                        source.name,
+                        source_name,
                         "error",
                         {"stage": "parse", "error_type": "TypeError"},
                         error=str(te),
-                        session=self.session
+                        session=session
                     )
                 except Exception as parse_err:
                     log_signal_activity(
-                        source.name,
+                        source_name,
                         "error",
                         {"stage": "parse", "error_type": type(parse_err).__name__},
                         error=str(parse_err),
-                        session=self.session
+                        session=session
+                    )
+            
+            existing_events = None
+            if mode == "PRODUCTION":
+                existing_events = _get_existing_event_ids_by_summary(
+                    session,
+                    [s.parsed_signal.context_summary for s in scored_signals if s.score >= threshold]
+                )
+            
+            signal_ids: List[int] = []
+            if scored_signals:
+                try:
+                    signal_ids = self._persist_signals([s.parsed_signal for s in scored_signals], source_name, session)
+                    result.persisted = len(signal_ids)
+                except Exception as persist_err:
+                    session.rollback()
+                    log_signal_activity(
+                        source_name,
+                        "error",
+                        {"stage": "persist", "error_type": type(persist_err).__name__},
+                        error=str(persist_err),
+                        session=session
+                    )
+            
+            pending_events: Dict[Tuple[Optional[int], str], Tuple[LeadEvent, int]] = {}
+            batch_duplicates: List[Tuple[Optional[int], str]] = []
+            for scored, signal_id in zip(scored_signals, signal_ids):
+                parsed = scored.parsed_signal
+                try:
+                    if scored.score >= threshold and mode == "PRODUCTION":
+                        is_self, self_reason = is_self_signal(parsed, session)
+                        if is_self:
+                            log_signal_activity(
+                                source_name,
+                                "skip_self_signal",
+                                {"score": scored.score, "reason": self_reason},
+                                session=session
+                            )
+                            print(f"[SIGNALNET][SELF_SIGNAL] Skipping: {self_reason}")
+                            continue
+                        
+                        # signal_id was inserted above, so no event can reference it yet
+                        lead_event = _build_lead_event(
+                            scored, session, signal_id, existing_events, check_signal_duplicate=False
+                        )
+                        if lead_event is None:
+                            continue
+                        
+                        key = (lead_event.company_id, lead_event.summary)
+                        if key in pending_events:
+                            batch_duplicates.append(key)
+                            continue
+                        
+                        pending_events[key] = (lead_event, scored.score)
+                    elif scored.score >= threshold and mode == "SANDBOX":
+                        log_signal_activity(
+                            source_name,
+                            "sandbox_skip_event",
+                            {"score": scored.score, "threshold": threshold, "reason": "SANDBOX mode"},
+                            session=session
+                        )
+                    
+                except Exception as event_err:
+                    log_signal_activity(
+                        source_name,
+                        "error",
+                        {"stage": "event", "error_type": type(event_err).__name__},
+                        error=str(event_err),
+                        session=session
+                    )
+            
+            if pending_events:
+                # One flush for the whole batch: a single multi-row INSERT ... RETURNING.
+                # The savepoint keeps a failed flush from rolling back the signals above.
+                try:
+                    with session.begin_nested():
+                        session.add_all([event for event, _ in pending_events.values()])
+                        session.flush()
+                except Exception as event_err:
+                    result.error = f"LeadEvent insert failed: {event_err}"
+                    log_signal_activity(
+                        source_name,
+                        "error",
+                        {"stage": "event", "error_type": type(event_err).__name__},
+                        error=str(event_err),
+                        session=session
                     )
+                else:
+                    for event, score in pending_events.values():
+                        _log_lead_event_created(event, score, existing_events, session)
+                    result.events_created = len(pending_events)
+                    for key in batch_duplicates:
+                        log_signal_activity(
+                            "pipeline",
+                            "skip_duplicate",
+                            {"existing_event_id": existing_events[key], "reason": "same_summary"},
+                            session=session
+                        )
             
-            source.record_run(result["fetched"])
+            session.commit()
+            
+            source.record_run(result.fetched)
             
+            scores = [scored.score for scored in scored_signals]
             log_signal_activity(
-                source.name,
+                source_name,
                 "complete",
                 {
-                    "fetched": result["fetched"],
-                    "parsed": result["parsed"],
-                    "persisted": result["persisted"],
-                    "events_created": result["events_created"],
+                    "fetched": result.fetched,
+                    "parsed": result.parsed,
+                    "persisted": result.persisted,
+                    "events_created": result.events_created,
+                    "avg_score": round(sum(scores) / len(scores), 1) if scores else None,
+                    "max_score": max(scores) if scores else None,
+                    "persisted_ids": signal_ids[:50],
                 },
-                signal_count=result["persisted"],
-                session=self.session
+                signal_count=result.persisted,
+                session=session
             )
             
         except requests.exceptions.ConnectionError as ce:
             error_msg = f"Connection error: {str(ce)}"
-            result["error"] = error_msg
+            result.error = error_msg
             source.record_run(0, error=error_msg)
             log_signal_activity(
-                source.name,
+                source_name,
                 "error",
                 {"stage": "fetch", "error_type": "ConnectionError"},
                 error=error_msg,
-                session=self.session
+                session=session
             )
         except requests.exceptions.Timeout as te:
             error_msg = f"Timeout error: {str(te)}"
-            result["error"] = error_msg
+            result.error = error_msg
             source.record_run(0, error=error_msg)
             log_signal_activity(
-                source.name,
+                source_name,
                 "error",
                 {"stage": "fetch", "error_type": "Timeout"},
                 error=error_msg,
-                session=self.session
+                session=session
             )
         except requests.exceptions.HTTPError as he:
             error_msg = f"HTTP error: {str(he)}"
-            result["error"] = error_msg
+            result.error = error_msg
             source.record_run(0, error=error_msg)
             log_signal_activity(
-                source.name,
+                source_name,
                 "error",
                 {"stage": "fetch", "error_type": "HTTPError", "status_code": getattr(he.response, 'status_code', None)},
                 error=error_msg,
-                session=self.session
+                session=session
             )
         except Exception as fetch_err:
             error_msg = str(fetch_err)
-            result["error"] = error_msg
+            result.error = error_msg
             source.record_run(0, error=error_msg)
             log_signal_activity(
-                source.name,
+                source_name,
                 "error",
                 {"stage": "fetch", "error_type": type(fetch_err).__name__},
                 error=error_msg,
-                session=self.session
+                session=session
             )
         
         return result
     
-    def _persist_signal(self, parsed: ParsedSignal, source_name: str) -> Signal:
-        """Persist a parsed signal to the database with structured logging."""
-        contact_info_obj = getattr(parsed, 'extracted_contact_info', None)
-        contact_info_json = json.dumps(contact_info_obj) if contact_info_obj else None
-        
-        signal = Signal(
-            company_id=parsed.company_id,
-            lead_id=parsed.lead_id,
-            source_type=parsed.source_type,
-            raw_payload=parsed.raw_payload,
-            context_summary=parsed.context_summary,
-            geography=parsed.geography,
-            extracted_contact_info=contact_info_json,
-        )
-        self.session.add(signal)
-        self.session.commit()
-        self.session.refresh(signal)
-        
-        log_signal_activity(
-            source_name,
-            "persist",
-            {
-                "signal_id": signal.id,
-                "source_type": parsed.source_type,
-                "geography": parsed.geography,
-                "summary_preview": parsed.context_summary[:60] if parsed.context_summary else None,
-            },
-            signal_count=1,
-            session=self.session
-        )
+    def _signal_row(self, parsed: ParsedSignal) -> Dict[str, Any]:
+        """Column values for the Signal row of a parsed signal."""
+        contact_info_obj = parsed.extracted_contact_info
+        contact_info_json = _dumps_payload(contact_info_obj) if contact_info_obj else None
         
-        return signal
-    
+        return {
+            "company_id": parsed.company_id,
+            "lead_id": parsed.lead_id,
+            "source_type": parsed.source_type,
+            "raw_payload": parsed.raw_payload,
+            "context_summary": parsed.context_summary,
+            "geography": parsed.geography,
+            "extracted_contact_info": contact_info_json,
+        }
+    
+    def _persist_signals(
+        self,
+        parsed_signals: List[ParsedSignal],
+        source_name: str,
+        session: Optional[Session] = None
+    ) -> List[int]:
+        """
+        Persist a batch of parsed signals with structured logging.
+        
+        Rows go in through one INSERT ... RETURNING id rather than ORM
+        objects, since the pipeline only needs the new ids (returned in input
+        order). The caller commits after LeadEvents are created for the batch.
+        """
+        session = session or self.session
+        signal_ids = list(session.scalars(
+            insert(Signal).returning(Signal.id, sort_by_parameter_order=True),
+            [self._signal_row(parsed) for parsed in parsed_signals],
+        ))
+        
+        if SIGNAL_LOG_VERBOSE:
+            for signal_id, parsed in zip(signal_ids, parsed_signals):
+                log_signal_activity(
+                    source_name,
+                    "persist",
+                    {
+                        "signal_id": signal_id,
+                        "source_type": parsed.source_type,
+                        "geography": parsed.geography,
+                        "summary_preview": parsed.context_summary[:60] if parsed.context_summary else None,
+                    },
+                    signal_count=1,
+                    session=session
+                )
+        
+        return signal_ids
+    
     def _create_lead_event(self, signal: Signal, scored: ScoredSignal, source_name: str) -> Optional[LeadEvent]:
         """
         Create a LeadEvent from a high-scoring signal with structured logging.
@@ -1671,9 +2214,11 @@ class WeatherSignalSource(SignalSource):
     DRY_RUN mode: Generates mock weather signals without API calls.
     """
     
+    # city_id (OpenWeatherMap city list) lets current conditions be fetched in
+    # one Group API call; locations without one fall back to a lat/lon lookup.
     SOUTH_FLORIDA_LOCATIONS = [
-        {"name": "Miami", "lat": 25.7617, "lon": -80.1918},
-        {"name": "Fort Lauderdale", "lat": 26.1224, "lon": -80.1373},
+        {"name": "Miami", "lat": 25.7617, "lon": -80.1918, "city_id": 4164138},
+        {"name": "Fort Lauderdale", "lat": 26.1224, "lon": -80.1373, "city_id": 4155966},
         {"name": "Palm Beach", "lat": 26.7056, "lon": -80.0364},
     ]
     
@@ -1686,76 +2231,88 @@ class WeatherSignalSource(SignalSource):
         "thunderstorm", "severe", "flood", "warning", "watch"
     ]
     
-    @property
-    def name(self) -> str:
-        return "weather_openweather"
+    # Storm detection works on the word set of a description, so the check is
+    # a set intersection instead of a substring scan per keyword. Compound
+    # words OpenWeatherMap uses ("thunderstorm") are listed explicitly since
+    # tokens no longer match inside longer words.
+    _WORD_RE = re.compile(r"[a-z]+")
+    _STORM_TOKENS = frozenset({"storm", "storms", "thunder", "thunderstorm", "thunderstorms", "severe"})
+    
+    # Alert event names are matched as substrings: "storm warning" must keep
+    # matching inside "Severe Thunderstorm Warnings" but not "Storm Surge Warning"
+    _TROPICAL_ALERT_KEYWORDS = ("hurricane", "tropical", "storm warning")
+    
+    EVENT_CATEGORY_MAP = {
+        "hurricane_alert": "HURRICANE_SEASON",
+        "storm": "HURRICANE_SEASON",
+        "extreme_heat": "OPPORTUNITY",
+        "cold_front": "OPPORTUNITY",
+        "heavy_rain": "HURRICANE_SEASON",
+    }
     
-    @property
-    def source_type(self) -> str:
-        return "weather"
+    CACHE_TTL = 300
+    _response_cache: Dict[Tuple[float, float, str], Tuple[Dict, float]] = {}
     
-    @property
-    def enabled(self) -> bool:
-        if self.is_dry_run:
-            return SIGNAL_MODE in ("SANDBOX", "PRODUCTION")
-        if not OPENWEATHER_API_KEY:
-            return False
-        return SIGNAL_MODE in ("SANDBOX", "PRODUCTION")
+    # OpenWeatherMap also answers 429/500 under load; retry those too
+    HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
     
-    @property
-    def cooldown_seconds(self) -> int:
-        return 3600
+    name = "weather_openweather"
+    source_type = "weather"
+    cooldown_seconds = 3600
+    max_items_per_run = 15
     
-    @property
-    def max_items_per_run(self) -> int:
-        return 15
+    @classmethod
+    def is_class_enabled(cls) -> bool:
+        return SIGNAL_MODE in _RUN_MODES and (SIGNAL_DRY_RUN or bool(OPENWEATHER_API_KEY))
+    
+    MOCK_EVENTS = (
+        {
+            "event_type": "extreme_heat",
+            "temp_f": 98,
+            "feels_like_f": 105,
+            "humidity": 75,
+            "description": "Extreme heat alert: 98°F (feels like 105°F)",
+            "business_impact": "HVAC demand surge expected",
+            "niche_opportunities": ["HVAC", "pool service", "landscaping"],
+        },
+        {
+            "event_type": "hurricane_alert",
+            "alert_event": "Tropical Storm Warning",
+            "description": "Tropical Storm approaching South Florida coast",
+            "business_impact": "Hurricane preparation and post-storm services",
+            "niche_opportunities": ["roofing", "restoration", "generators", "tree service"],
+        },
+        {
+            "event_type": "heavy_rain",
+            "rain_mm": 35,
+            "description": "Heavy rainfall expected throughout the day",
+            "business_impact": "Roofing and water damage service demand",
+            "niche_opportunities": ["roofing", "water damage restoration", "plumbing"],
+        },
+    )
     
     def _generate_mock_signals(self) -> List[RawSignal]:
         """Generate mock weather signals for DRY_RUN mode."""
-        mock_events = [
-            {
-                "event_type": "extreme_heat",
-                "temp_f": 98,
-                "feels_like_f": 105,
-                "humidity": 75,
-                "description": "Extreme heat alert: 98°F (feels like 105°F)",
-                "business_impact": "HVAC demand surge expected",
-                "niche_opportunities": ["HVAC", "pool service", "landscaping"],
-            },
-            {
-                "event_type": "hurricane_alert",
-                "alert_event": "Tropical Storm Warning",
-                "description": "Tropical Storm approaching South Florida coast",
-                "business_impact": "Hurricane preparation and post-storm services",
-                "niche_opportunities": ["roofing", "restoration", "generators", "tree service"],
-            },
-            {
-                "event_type": "heavy_rain",
-                "rain_mm": 35,
-                "description": "Heavy rainfall expected throughout the day",
-                "business_impact": "Roofing and water damage service demand",
-                "niche_opportunities": ["roofing", "water damage restoration", "plumbing"],
-            },
-        ]
         
-        signals = []
         num_signals = random.randint(1, 3)
+        events = random.choices(self.MOCK_EVENTS, k=num_signals)
+        locations = random.choices(self.SOUTH_FLORIDA_LOCATIONS, k=num_signals)
+        generated_at = datetime.utcnow().isoformat()
         
-        for i in range(num_signals):
-            event = random.choice(mock_events)
-            location = random.choice(self.SOUTH_FLORIDA_LOCATIONS)
-            
-            signals.append(RawSignal(
+        signals = [
+            RawSignal(
                 source_name=self.name,
                 source_type="weather",
                 raw_data={
                     **event,
                     "location": location["name"],
                     "mock": True,
-                    "generated_at": datetime.utcnow().isoformat(),
+                    "generated_at": generated_at,
                 },
                 geography=location["name"],
-            ))
+            )
+            for event, location in zip(events, locations)
+        ]
         
         log_signal_activity(
             self.name,
@@ -1779,50 +2336,91 @@ class WeatherSignalSource(SignalSource):
             return []
         
         signals = []
+        log_entries: List[Dict[str, Any]] = []
+        self._http_session()
+        grouped_locations = [loc for loc in self.SOUTH_FLORIDA_LOCATIONS if loc.get("city_id")]
+        
+        # Issue the current-weather and alerts requests for every location at
+        # once; the calls are pure network I/O, so wall time is ~one round trip.
+        with ThreadPoolExecutor(max_workers=len(self.SOUTH_FLORIDA_LOCATIONS) * 2) as executor:
+            group_future = (
+                executor.submit(self._fetch_current_weather_group, grouped_locations)
+                if grouped_locations else None
+            )
+            pending = [
+                (
+                    location,
+                    None if location.get("city_id") else executor.submit(self._fetch_current_weather, location),
+                    executor.submit(self._fetch_weather_alerts, location),
+                )
+                for location in self.SOUTH_FLORIDA_LOCATIONS
+            ]
+        
+        # A failed Group call (e.g. malformed JSON) must not abort the run:
+        # the loop below falls back to one request per city.
+        current_by_city_id: Dict[int, Dict] = {}
+        if group_future is not None:
+            try:
+                current_by_city_id = group_future.result()
+            except Exception as e:
+                print(f"[SIGNALNET][WEATHER] Group weather lookup failed, using per-city requests: {e}")
         
-        for location in self.SOUTH_FLORIDA_LOCATIONS:
+        for location, current_future, alerts_future in pending:
             try:
-                current_data = self._fetch_current_weather(location)
+                if current_future is not None:
+                    current_data = current_future.result()
+                else:
+                    current_data = current_by_city_id.get(location["city_id"]) or self._fetch_current_weather(location)
                 if current_data:
                     signals.extend(self._analyze_current_weather(current_data, location))
                 
-                alerts_data = self._fetch_weather_alerts(location)
+                alerts_data = alerts_future.result()
                 if alerts_data:
                     signals.extend(self._analyze_weather_alerts(alerts_data, location))
-                    
-                time.sleep(0.25)
                 
-            except requests.exceptions.RequestException as e:
-                log_signal_activity(
-                    self.name,
-                    "error",
-                    {"stage": "fetch_location", "location": location["name"], "error_type": type(e).__name__},
-                    error=str(e),
-                    session=get_log_session()
-                )
-                continue
             except Exception as e:
-                log_signal_activity(
-                    self.name,
-                    "error",
-                    {"stage": "fetch_location", "location": location["name"], "error_type": type(e).__name__},
-                    error=str(e),
-                    session=get_log_session()
-                )
+                log_entries.append({
+                    "source_name": self.name,
+                    "action": "error",
+                    "details": {"stage": "fetch_location", "location": location["name"], "error_type": type(e).__name__},
+                    "error": str(e),
+                })
                 continue
         
-        log_signal_activity(
-            self.name,
-            "fetch_complete",
-            {"locations_checked": len(self.SOUTH_FLORIDA_LOCATIONS), "signals_found": len(signals)},
-            signal_count=len(signals),
-            session=get_log_session()
-        )
+        log_entries.append({
+            "source_name": self.name,
+            "action": "fetch_complete",
+            "details": {"locations_checked": len(self.SOUTH_FLORIDA_LOCATIONS), "signals_found": len(signals)},
+            "signal_count": len(signals),
+        })
+        log_signal_activity_batch(log_entries, session=get_log_session())
         
         return signals
     
+    def _cache_key(self, location: Dict, endpoint: str) -> Tuple[float, float, str]:
+        return (round(location["lat"], 3), round(location["lon"], 3), endpoint)
+    
+    def _get_cached_response(self, key: Tuple[float, float, str]) -> Optional[Dict]:
+        """Get cached API response if still valid."""
+        cached = self._response_cache.get(key)
+        if cached:
+            data, timestamp = cached
+            if time.time() - timestamp < self.CACHE_TTL:
+                return data
+        return None
+    
+    def _cache_response(self, key: Tuple[float, float, str], data: Dict) -> None:
+        """Cache a successful API response."""
+        self._response_cache[key] = (data, time.time())
+    
     def _fetch_current_weather(self, location: Dict) -> Optional[Dict]:
         """Fetch current weather for a location."""
+        import requests
+        
+        cache_key = self._cache_key(location, "weather")
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
         try:
             url = "https://api.openweathermap.org/data/2.5/weather"
             params = {
@@ -1831,15 +2429,67 @@ class WeatherSignalSource(SignalSource):
                 "appid": OPENWEATHER_API_KEY,
                 "units": "imperial"
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = self._http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            self._cache_response(cache_key, data)
+            return data
         except requests.RequestException as e:
             print(f"[SIGNALNET][WEATHER] Current weather API error: {e}")
             return None
     
+    def _fetch_current_weather_group(self, locations: List[Dict]) -> Dict[int, Dict]:
+        """
+        Fetch current weather for several locations in one Group API call.
+        
+        Returns {city_id: current weather data}. Each entry is also cached
+        under the location's lat/lon key, so it is shared with
+        _fetch_current_weather().
+        """
+        import requests
+        
+        current_by_city_id = {}
+        uncached = []
+        for location in locations:
+            cached = self._get_cached_response(self._cache_key(location, "weather"))
+            if cached is not None:
+                current_by_city_id[location["city_id"]] = cached
+            else:
+                uncached.append(location)
+        
+        if not uncached:
+            return current_by_city_id
+        
+        try:
+            url = "https://api.openweathermap.org/data/2.5/group"
+            params = {
+                "id": ",".join(str(location["city_id"]) for location in uncached),
+                "appid": OPENWEATHER_API_KEY,
+                "units": "imperial"
+            }
+            response = self._http_session().get(url, params=params, timeout=10)
+            response.raise_for_status()
+            entries = {entry.get("id"): entry for entry in response.json().get("list", [])}
+        except requests.RequestException as e:
+            print(f"[SIGNALNET][WEATHER] Group weather API error: {e}")
+            return current_by_city_id
+        
+        for location in uncached:
+            data = entries.get(location["city_id"])
+            if data:
+                self._cache_response(self._cache_key(location, "weather"), data)
+                current_by_city_id[location["city_id"]] = data
+        
+        return current_by_city_id
+    
     def _fetch_weather_alerts(self, location: Dict) -> Optional[Dict]:
         """Fetch weather alerts using One Call API (if available)."""
+        import requests
+        
+        cache_key = self._cache_key(location, "onecall")
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
         try:
             url = "https://api.openweathermap.org/data/2.5/onecall"
             params = {
@@ -1849,94 +2499,123 @@ class WeatherSignalSource(SignalSource):
                 "exclude": "minutely,hourly,daily",
                 "units": "imperial"
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = self._http_session().get(url, params=params, timeout=10)
             if response.status_code == 401:
                 return None
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            self._cache_response(cache_key, data)
+            return data
         except requests.RequestException:
             return None
     
+    def _words(self, *texts: str) -> FrozenSet[str]:
+        """Lowercased word set across the given texts."""
+        return frozenset(self._WORD_RE.findall(" ".join(texts).lower()))
+    
     def _analyze_current_weather(self, data: Dict, location: Dict) -> List[RawSignal]:
         """Analyze current weather for business-relevant signals."""
-        signals = []
-        
         main = data.get("main", {})
         weather = data.get("weather", [{}])[0]
         rain = data.get("rain", {})
         
         temp_f = main.get("temp", 70)
         feels_like_f = main.get("feels_like", 70)
-        humidity = main.get("humidity", 50)
         description = weather.get("description", "").lower()
         weather_main = weather.get("main", "").lower()
-        
-        if temp_f >= self.HEAT_THRESHOLD_F or feels_like_f >= self.HEAT_THRESHOLD_F:
-            signals.append(RawSignal(
-                source_name=self.name,
-                source_type="weather",
-                raw_data={
-                    "event_type": "extreme_heat",
-                    "temp_f": temp_f,
-                    "feels_like_f": feels_like_f,
-                    "humidity": humidity,
-                    "location": location["name"],
-                    "description": f"Extreme heat alert: {temp_f}°F (feels like {feels_like_f}°F)",
-                    "business_impact": "HVAC demand surge expected",
-                    "niche_opportunities": ["HVAC", "pool service", "landscaping"],
-                },
-                geography=location["name"],
-            ))
-        
-        if temp_f <= self.COLD_THRESHOLD_F:
-            signals.append(RawSignal(
-                source_name=self.name,
-                source_type="weather",
-                raw_data={
-                    "event_type": "cold_front",
-                    "temp_f": temp_f,
-                    "feels_like_f": feels_like_f,
-                    "location": location["name"],
-                    "description": f"Cold front: {temp_f}°F (feels like {feels_like_f}°F)",
-                    "business_impact": "Heating and winterization demand",
-                    "niche_opportunities": ["HVAC", "plumbing", "landscaping"],
-                },
-                geography=location["name"],
-            ))
-        
         rain_1h = rain.get("1h", 0)
-        if rain_1h >= self.HEAVY_RAIN_THRESHOLD_MM or "heavy rain" in description:
-            signals.append(RawSignal(
-                source_name=self.name,
-                source_type="weather",
-                raw_data={
-                    "event_type": "heavy_rain",
-                    "rain_mm": rain_1h,
-                    "location": location["name"],
-                    "description": f"Heavy rain in {location['name']}: {rain_1h}mm/hour",
-                    "business_impact": "Roofing and water damage service demand",
-                    "niche_opportunities": ["roofing", "water damage restoration", "plumbing"],
-                },
-                geography=location["name"],
-            ))
         
-        is_storm = any(kw in description or kw in weather_main for kw in ["storm", "thunder", "severe"])
-        if is_storm:
-            signals.append(RawSignal(
-                source_name=self.name,
-                source_type="weather",
-                raw_data={
-                    "event_type": "storm",
-                    "weather_main": weather_main,
-                    "description": f"Storm conditions in {location['name']}: {description}",
-                    "location": location["name"],
-                    "business_impact": "Storm damage and emergency services demand",
-                    "niche_opportunities": ["roofing", "tree service", "restoration"],
-                },
-                geography=location["name"],
-            ))
+        # One bit per condition, in _CONDITION_BUILDERS order.
+        flags = (
+            (temp_f >= self.HEAT_THRESHOLD_F or feels_like_f >= self.HEAT_THRESHOLD_F)
+            | (temp_f <= self.COLD_THRESHOLD_F) << 1
+            | (rain_1h >= self.HEAVY_RAIN_THRESHOLD_MM or "heavy rain" in description) << 2
+            | (not self._STORM_TOKENS.isdisjoint(self._words(description, weather_main))) << 3
+        )
+        if not flags:
+            return []
         
-        return signals
+        readings = {
+            "temp_f": temp_f,
+            "feels_like_f": feels_like_f,
+            "humidity": main.get("humidity", 50),
+            "rain_1h": rain_1h,
+            "description": description,
+            "weather_main": weather_main,
+        }
+        return [
+            builder(self, location, readings)
+            for bit, builder in enumerate(self._CONDITION_BUILDERS)
+            if flags >> bit & 1
+        ]
+    
+    def _build_heat_signal(self, location: Dict, readings: Dict) -> RawSignal:
+        temp_f, feels_like_f = readings["temp_f"], readings["feels_like_f"]
+        return RawSignal(
+            source_name=self.name,
+            source_type="weather",
+            raw_data={
+                "event_type": "extreme_heat",
+                "temp_f": temp_f,
+                "feels_like_f": feels_like_f,
+                "humidity": readings["humidity"],
+                "location": location["name"],
+                "description": f"Extreme heat alert: {temp_f}°F (feels like {feels_like_f}°F)",
+                "business_impact": "HVAC demand surge expected",
+                "niche_opportunities": ["HVAC", "pool service", "landscaping"],
+            },
+            geography=location["name"],
+        )
+    
+    def _build_cold_signal(self, location: Dict, readings: Dict) -> RawSignal:
+        temp_f, feels_like_f = readings["temp_f"], readings["feels_like_f"]
+        return RawSignal(
+            source_name=self.name,
+            source_type="weather",
+            raw_data={
+                "event_type": "cold_front",
+                "temp_f": temp_f,
+                "feels_like_f": feels_like_f,
+                "location": location["name"],
+                "description": f"Cold front: {temp_f}°F (feels like {feels_like_f}°F)",
+                "business_impact": "Heating and winterization demand",
+                "niche_opportunities": ["HVAC", "plumbing", "landscaping"],
+            },
+            geography=location["name"],
+        )
+    
+    def _build_rain_signal(self, location: Dict, readings: Dict) -> RawSignal:
+        rain_1h = readings["rain_1h"]
+        return RawSignal(
+            source_name=self.name,
+            source_type="weather",
+            raw_data={
+                "event_type": "heavy_rain",
+                "rain_mm": rain_1h,
+                "location": location["name"],
+                "description": f"Heavy rain in {location['name']}: {rain_1h}mm/hour",
+                "business_impact": "Roofing and water damage service demand",
+                "niche_opportunities": ["roofing", "water damage restoration", "plumbing"],
+            },
+            geography=location["name"],
+        )
+    
+    def _build_storm_signal(self, location: Dict, readings: Dict) -> RawSignal:
+        return RawSignal(
+            source_name=self.name,
+            source_type="weather",
+            raw_data={
+                "event_type": "storm",
+                "weather_main": readings["weather_main"],
+                "description": f"Storm conditions in {location['name']}: {readings['description']}",
+                "location": location["name"],
+                "business_impact": "Storm damage and emergency services demand",
+                "niche_opportunities": ["roofing", "tree service", "restoration"],
+            },
+            geography=location["name"],
+        )
+    
+    _CONDITION_BUILDERS = (_build_heat_signal, _build_cold_signal, _build_rain_signal, _build_storm_signal)
     
     def _analyze_weather_alerts(self, data: Dict, location: Dict) -> List[RawSignal]:
         """Analyze weather alerts for hurricane/tropical storm signals."""
@@ -1947,7 +2626,7 @@ class WeatherSignalSource(SignalSource):
             event = alert.get("event", "").lower()
             description = alert.get("description", "")
             
-            is_tropical = any(kw in event for kw in ["hurricane", "tropical", "storm warning"])
+            is_tropical = any(keyword in event for keyword in self._TROPICAL_ALERT_KEYWORDS)
             
             if is_tropical:
                 signals.append(RawSignal(
@@ -1972,15 +2651,7 @@ class WeatherSignalSource(SignalSource):
     def parse(self, raw: RawSignal) -> ParsedSignal:
         """Parse weather signal into standardized format."""
         event_type = raw.raw_data.get("event_type", "weather")
-        
-        category_map = {
-            "hurricane_alert": "HURRICANE_SEASON",
-            "storm": "HURRICANE_SEASON",
-            "extreme_heat": "OPPORTUNITY",
-            "cold_front": "OPPORTUNITY",
-            "heavy_rain": "HURRICANE_SEASON",
-        }
-        category = category_map.get(event_type, "OPPORTUNITY")
+        category = self.EVENT_CATEGORY_MAP.get(event_type, "OPPORTUNITY")
         
         niche_opportunities = raw.raw_data.get("niche_opportunities", [])
         niche_hint = niche_opportunities[0] if niche_opportunities else None
@@ -1992,7 +2663,7 @@ class WeatherSignalSource(SignalSource):
         
         return ParsedSignal(
             source_type="weather",
-            raw_payload=json.dumps(raw.raw_data),
+            raw_payload=_dumps_payload(raw.raw_data),
             context_summary=context,
             geography=raw.geography,
             category_hint=category,
@@ -2025,74 +2696,97 @@ class NewsSearchSignalSource(SignalSource):
     
     GOOGLE_NEWS_RSS_BASE = "https://news.google.com/rss/search"
     
-    @property
-    def name(self) -> str:
-        return "news_search"
+    # One scan finds every geography mentioned; GEOGRAPHY_GROUPS order breaks
+    # ties (a title naming Broward and Miami maps to Miami).
+    _GEOGRAPHY_RE = re.compile(
+        r"(?P<miami>miami|dade)|(?P<fort_lauderdale>fort lauderdale|broward)|(?P<palm_beach>palm beach)",
+        re.IGNORECASE,
+    )
+    GEOGRAPHY_GROUPS = {
+        "miami": "Miami",
+        "fort_lauderdale": "Fort Lauderdale",
+        "palm_beach": "Palm Beach",
+    }
     
-    @property
-    def source_type(self) -> str:
-        return "news"
+    # Keyword matchers, checked in order (first match wins).
+    CATEGORY_PATTERNS = (
+        (_compile_keywords(["opening", "new business", "launches", "expands"]), "GROWTH_SIGNAL"),
+        (_compile_keywords(["competitor", "rivalry", "market share"]), "COMPETITOR_SHIFT"),
+        (_compile_keywords(["development", "construction", "project"]), "GROWTH_SIGNAL"),
+    )
+    # Checked in priority order; each niche is one precompiled alternation, so
+    # a miss costs one C-level scan per niche and a hit returns immediately.
+    NICHE_PATTERNS = (
+        (_compile_keywords(["hvac", "air conditioning", "heating", "cooling"]), "hvac"),
+        (_compile_keywords(["roof", "roofing", "roofer"]), "roofing"),
+        (_compile_keywords(["med spa", "medspa", "medical spa", "aesthetics", "botox"]), "med spa"),
+        (_compile_keywords(["plumb", "plumber", "plumbing"]), "plumbing"),
+        (_compile_keywords(["landscape", "landscaping", "lawn"]), "landscaping"),
+        (_compile_keywords(["restaurant", "dining", "food service"]), "restaurant"),
+        (_compile_keywords(["attorney", "lawyer", "law firm", "legal"]), "legal"),
+    )
+    _URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+    _EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    _PHONE_RE = re.compile(r'(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
     
-    @property
-    def enabled(self) -> bool:
-        return SIGNAL_MODE in ("SANDBOX", "PRODUCTION")
+    name = "news_search"
+    source_type = "news"
+    cooldown_seconds = 7200
+    max_items_per_run = 25
     
-    @property
-    def cooldown_seconds(self) -> int:
-        return 7200
+    @classmethod
+    def is_class_enabled(cls) -> bool:
+        return SIGNAL_MODE in _RUN_MODES
     
-    @property
-    def max_items_per_run(self) -> int:
-        return 25
+    MOCK_ARTICLES = (
+        {
+            "title": "New HVAC company opens in Coral Gables, promises 24/7 service",
+            "source": "Miami Herald",
+            "query": "Miami HVAC company",
+            "geography": "Miami",
+        },
+        {
+            "title": "South Florida roofing contractor expands operations after hurricane season",
+            "source": "Sun Sentinel",
+            "query": "South Florida roofing contractor",
+            "geography": "Fort Lauderdale",
+        },
+        {
+            "title": "Med spa franchise opening 3 new locations in Broward County",
+            "source": "Brickell Magazine",
+            "query": "Miami med spa opening",
+            "geography": "Fort Lauderdale",
+        },
+        {
+            "title": "New commercial development project approved for downtown Miami",
+            "source": "Miami Today",
+            "query": "South Florida commercial development",
+            "geography": "Miami",
+        },
+    )
     
     def _generate_mock_signals(self) -> List[RawSignal]:
         """Generate mock news signals for DRY_RUN mode."""
-        mock_articles = [
-            {
-                "title": "New HVAC company opens in Coral Gables, promises 24/7 service",
-                "source": "Miami Herald",
-                "query": "Miami HVAC company",
-                "geography": "Miami",
-            },
-            {
-                "title": "South Florida roofing contractor expands operations after hurricane season",
-                "source": "Sun Sentinel",
-                "query": "South Florida roofing contractor",
-                "geography": "Fort Lauderdale",
-            },
-            {
-                "title": "Med spa franchise opening 3 new locations in Broward County",
-                "source": "Brickell Magazine",
-                "query": "Miami med spa opening",
-                "geography": "Fort Lauderdale",
-            },
-            {
-                "title": "New commercial development project approved for downtown Miami",
-                "source": "Miami Today",
-                "query": "South Florida commercial development",
-                "geography": "Miami",
-            },
-        ]
         
-        signals = []
-        num_signals = random.randint(2, 4)
+        articles = random.choices(self.MOCK_ARTICLES, k=random.randint(2, 4))
+        published = datetime.utcnow().isoformat()
         
-        for i in range(num_signals):
-            article = random.choice(mock_articles)
-            
-            signals.append(RawSignal(
+        signals = [
+            RawSignal(
                 source_name=self.name,
                 source_type="news",
                 raw_data={
                     "title": article["title"],
                     "link": f"https://example.com/mock-news-{i}",
-                    "published": datetime.utcnow().isoformat(),
+                    "published": published,
                     "source": article["source"],
                     "query": article["query"],
                     "mock": True,
                 },
                 geography=article["geography"],
-            ))
+            )
+            for i, article in enumerate(articles)
+        ]
         
         log_signal_activity(
             self.name,
@@ -2107,11 +2801,21 @@ class NewsSearchSignalSource(SignalSource):
     def fetch(self) -> List[RawSignal]:
         """Fetch news from Google News RSS feeds."""
         signals = []
-        
-        for query in self.SEARCH_QUERIES:
+        log_entries: List[Dict[str, Any]] = []
+        
+        # Queries are independent round trips; issue them concurrently over
+        # one keep-alive session instead of one after another.
+        self._http_session()
+        with ThreadPoolExecutor(max_workers=len(self.SEARCH_QUERIES)) as executor:
+            pending = [
+                (query, executor.submit(self._fetch_google_news_rss, query))
+                for query in self.SEARCH_QUERIES
+            ]
+        
+        for query, future in pending:
             try:
-                articles = self._fetch_google_news_rss(query)
-                for article in articles[:5]:
+                articles = future.result()
+                for article in articles:
                     signals.append(RawSignal(
                         source_name=self.name,
                         source_type="news",
@@ -2125,39 +2829,32 @@ class NewsSearchSignalSource(SignalSource):
                         geography=self._extract_geography(article.get("title", "") + " " + query),
                     ))
                 
-                time.sleep(0.5)
-                
-            except requests.exceptions.RequestException as e:
-                log_signal_activity(
-                    self.name,
-                    "error",
-                    {"stage": "fetch_query", "query": query, "error_type": type(e).__name__},
-                    error=str(e),
-                    session=get_log_session()
-                )
-                continue
             except Exception as e:
-                log_signal_activity(
-                    self.name,
-                    "error",
-                    {"stage": "fetch_query", "query": query, "error_type": type(e).__name__},
-                    error=str(e),
-                    session=get_log_session()
-                )
+                log_entries.append({
+                    "source_name": self.name,
+                    "action": "error",
+                    "details": {"stage": "fetch_query", "query": query, "error_type": type(e).__name__},
+                    "error": str(e),
+                })
                 continue
         
-        log_signal_activity(
-            self.name,
-            "fetch_complete",
-            {"queries_checked": len(self.SEARCH_QUERIES), "signals_found": len(signals)},
-            signal_count=len(signals),
-            session=get_log_session()
-        )
+        log_entries.append({
+            "source_name": self.name,
+            "action": "fetch_complete",
+            "details": {"queries_checked": len(self.SEARCH_QUERIES), "signals_found": len(signals)},
+            "signal_count": len(signals),
+        })
+        log_signal_activity_batch(log_entries, session=get_log_session())
         
         return signals
     
-    def _fetch_google_news_rss(self, query: str) -> List[Dict]:
-        """Fetch news articles from Google News RSS feed."""
+    def _fetch_google_news_rss(self, query: str, limit: int = 5) -> List[Dict]:
+        """
+        Fetch up to `limit` news articles from Google News RSS feed.
+        
+        The feed is parsed incrementally from the response stream and the
+        download stops once `limit` items have been read.
+        """
         import urllib.parse
         import xml.etree.ElementTree as ET
         
@@ -2169,24 +2866,25 @@ class NewsSearchSignalSource(SignalSource):
                 "User-Agent": "Mozilla/5.0 (compatible; HossAgent/1.0; +https://hossagent.net)"
             }
             
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.content)
-            
             articles = []
-            for item in root.findall(".//item"):
-                title = item.find("title")
-                link = item.find("link")
-                pub_date = item.find("pubDate")
-                source = item.find("source")
+            with self._http_session().get(url, headers=headers, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
                 
-                articles.append({
-                    "title": title.text if title is not None else "",
-                    "link": link.text if link is not None else "",
-                    "published": pub_date.text if pub_date is not None else "",
-                    "source": source.text if source is not None else "",
-                })
+                for _, item in ET.iterparse(response.raw, events=("end",)):
+                    if item.tag != "item":
+                        continue
+                    
+                    articles.append({
+                        "title": item.findtext("title", ""),
+                        "link": item.findtext("link", ""),
+                        "published": item.findtext("pubDate", ""),
+                        "source": item.findtext("source", ""),
+                    })
+                    item.clear()
+                    
+                    if len(articles) >= limit:
+                        break
             
             return articles
             
@@ -2195,65 +2893,26 @@ class NewsSearchSignalSource(SignalSource):
             return []
     
     def _extract_geography(self, text: str) -> Optional[str]:
-        """Extract geography from text."""
-        text_lower = text.lower()
-        
-        if "miami" in text_lower or "dade" in text_lower:
-            return "Miami"
-        elif "fort lauderdale" in text_lower or "broward" in text_lower:
-            return "Fort Lauderdale"
-        elif "palm beach" in text_lower:
-            return "Palm Beach"
-        elif "south florida" in text_lower:
-            return "South Florida"
-        else:
-            return "South Florida"
-    
-    def _infer_category(self, title: str, query: str) -> str:
-        """Infer signal category from news content."""
-        text_lower = (title + " " + query).lower()
-        
-        if any(kw in text_lower for kw in ["opening", "new business", "launches", "expands"]):
-            return "GROWTH_SIGNAL"
-        elif any(kw in text_lower for kw in ["competitor", "rivalry", "market share"]):
-            return "COMPETITOR_SHIFT"
-        elif any(kw in text_lower for kw in ["development", "construction", "project"]):
-            return "GROWTH_SIGNAL"
-        else:
-            return "OPPORTUNITY"
-    
-    def _infer_niche(self, title: str, query: str) -> Optional[str]:
-        """Infer niche from news content."""
-        text_lower = (title + " " + query).lower()
-        
-        niche_keywords = {
-            "hvac": ["hvac", "air conditioning", "heating", "cooling"],
-            "roofing": ["roof", "roofing", "roofer"],
-            "med spa": ["med spa", "medspa", "medical spa", "aesthetics", "botox"],
-            "plumbing": ["plumb", "plumber", "plumbing"],
-            "landscaping": ["landscape", "landscaping", "lawn"],
-            "restaurant": ["restaurant", "dining", "food service"],
-            "legal": ["attorney", "lawyer", "law firm", "legal"],
-        }
-        
-        for niche, keywords in niche_keywords.items():
-            if any(kw in text_lower for kw in keywords):
-                return niche
-        
-        return None
+        """Extract geography from text (first match in GEOGRAPHY_GROUPS priority order)."""
+        found = {match.lastgroup for match in self._GEOGRAPHY_RE.finditer(text)}
+        for group, geography in self.GEOGRAPHY_GROUPS.items():
+            if group in found:
+                return geography
+        return "South Florida"
     
     def parse(self, raw: RawSignal) -> ParsedSignal:
         """Parse news signal into standardized format and extract contact info."""
-        import re
-        
-        title = raw.raw_data.get("title", "News article")
-        query = raw.raw_data.get("query", "")
-        source = raw.raw_data.get("source", "Unknown")
-        link = raw.raw_data.get("link", "")
+        # fetch() and the mock generator always populate these keys
+        data = raw.raw_data
+        title = data["title"]
+        query = data["query"]
+        source = data["source"]
+        link = data["link"]
         full_text = f"{title} {query} {source} {link}"
         
-        category = self._infer_category(title, query)
-        niche = self._infer_niche(title, query)
+        text_lower = (title + " " + query).lower()
+        category = _infer_news_category(text_lower)
+        niche = _infer_news_niche(text_lower)
         
         context = f"News: {title}"
         if source:
@@ -2263,16 +2922,13 @@ class NewsSearchSignalSource(SignalSource):
         extracted_emails = []
         extracted_phones = []
         
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, full_text)
+        urls = self._URL_RE.findall(full_text)
         extracted_urls = list(set([u.rstrip('.,;:)') for u in urls if u]))[:5]
         
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, full_text)
+        emails = self._EMAIL_RE.findall(full_text)
         extracted_emails = list(set([e.lower() for e in emails if '@' in e]))[:3]
         
-        phone_pattern = r'(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, full_text)
+        phones = self._PHONE_RE.findall(full_text)
         extracted_phones = list(set(phones))[:2]
         
         metadata = {
@@ -2282,17 +2938,33 @@ class NewsSearchSignalSource(SignalSource):
             "source_confidence": 0.85 if extracted_urls or extracted_emails else 0.5,
         }
         
-        parsed = ParsedSignal(
+        return ParsedSignal(
             source_type="news",
-            raw_payload=json.dumps(raw.raw_data),
+            raw_payload=_dumps_payload(raw.raw_data),
             context_summary=context[:500],
             geography=raw.geography,
             category_hint=category,
             niche_hint=niche,
+            extracted_contact_info=metadata,
         )
-        parsed.extracted_contact_info = metadata
-        
-        return parsed
+
+
+@lru_cache(maxsize=1024)
+def _infer_news_category(text_lower: str) -> str:
+    """Cached NewsSearchSignalSource category lookup (titles repeat across queries)."""
+    for pattern, category in NewsSearchSignalSource.CATEGORY_PATTERNS:
+        if pattern.search(text_lower):
+            return category
+    return "OPPORTUNITY"
+
+
+@lru_cache(maxsize=1024)
+def _infer_news_niche(text_lower: str) -> Optional[str]:
+    """Cached NewsSearchSignalSource niche lookup."""
+    for pattern, niche in NewsSearchSignalSource.NICHE_PATTERNS:
+        if pattern.search(text_lower):
+            return niche
+    return None
 
 
 class RedditSignalSource(SignalSource):
@@ -2312,6 +2984,11 @@ class RedditSignalSource(SignalSource):
     """
     
     SUBREDDITS = ["Miami", "FortLauderdale", "southflorida"]
+    SUBREDDIT_GEOGRAPHY = {
+        "Miami": "Miami",
+        "FortLauderdale": "Fort Lauderdale",
+        "southflorida": "South Florida",
+    }
     
     _blocked = False
     _consecutive_failures = 0
@@ -2323,66 +3000,80 @@ class RedditSignalSource(SignalSource):
         "roofer", "roofing", "lawyer", "attorney", "doctor",
         "mechanic", "electrician", "handyman", "moving company",
     ]
+    _SERVICE_KEYWORDS_RE = _compile_keywords(SERVICE_KEYWORDS)
+    
+    # Keyword matchers, checked in order (first match wins).
+    # Checked in priority order; each niche is one precompiled alternation, so
+    # a miss costs one C-level scan per niche and a hit returns immediately.
+    NICHE_PATTERNS = (
+        (_compile_keywords(["hvac", "ac ", "a/c", "air conditioning", "heating", "cooling"]), "HVAC"),
+        (_compile_keywords(["roof", "roofing", "roofer", "shingles"]), "Roofing"),
+        (_compile_keywords(["plumber", "plumbing", "pipe", "drain", "water heater"]), "Plumbing"),
+        (_compile_keywords(["electrician", "electrical", "wiring"]), "Electrical"),
+        (_compile_keywords(["lawyer", "attorney", "legal"]), "Legal"),
+        (_compile_keywords(["doctor", "clinic", "medical", "dentist"]), "Medical"),
+        (_compile_keywords(["mechanic", "auto", "car repair"]), "Automotive"),
+        (_compile_keywords(["handyman", "contractor", "renovation", "remodel"]), "Home Services"),
+        (_compile_keywords(["moving company", "movers", "relocation"]), "Moving"),
+    )
+    _REQUEST_RE = _compile_keywords(["recommend", "looking for", "anyone know", "who do you use", "need help", "urgent", "emergency"])
+    _GROWTH_RE = _compile_keywords(["new business", "opening", "just opened"])
     
     REDDIT_BASE_URL = "https://www.reddit.com"
+    MAX_RESPONSE_BYTES = 2 * 1024 * 1024
     
-    @property
-    def name(self) -> str:
-        return "reddit_local"
-    
-    @property
-    def source_type(self) -> str:
-        return "social"
+    name = "reddit_local"
+    source_type = "social"
+    cooldown_seconds = 3600
+    max_items_per_run = 30
     
-    @property
-    def enabled(self) -> bool:
-        if self.is_dry_run:
-            return SIGNAL_MODE in ("SANDBOX", "PRODUCTION")
+    @classmethod
+    def is_class_enabled(cls) -> bool:
+        if SIGNAL_DRY_RUN:
+            return SIGNAL_MODE in _RUN_MODES
         if RedditSignalSource._blocked:
             return False
-        return SIGNAL_MODE in ("SANDBOX", "PRODUCTION")
+        return SIGNAL_MODE in _RUN_MODES
+    
+    MOCK_POSTS = (
+        {
+            "title": "Looking for a reliable HVAC company in Miami - AC stopped working",
+            "selftext": "My AC unit is making weird noises and isn't cooling. Anyone know a good, honest HVAC technician in the Miami area?",
+            "subreddit": "Miami",
+            "score": 15,
+            "num_comments": 23,
+        },
+        {
+            "title": "Recommend a good roofing contractor in Fort Lauderdale?",
+            "selftext": "Need some roof repairs after the last storm. Looking for recommendations for a licensed roofer.",
+            "subreddit": "FortLauderdale",
+            "score": 8,
+            "num_comments": 12,
+        },
+        {
+            "title": "Best immigration attorney in South Florida?",
+            "selftext": "Looking for an experienced immigration lawyer. Need help with visa process. Any recommendations?",
+            "subreddit": "southflorida",
+            "score": 22,
+            "num_comments": 45,
+        },
+        {
+            "title": "Need help finding a plumber in Brickell area",
+            "selftext": "Have a leak under my kitchen sink. Anyone know a good plumber who does same-day service?",
+            "subreddit": "Miami",
+            "score": 5,
+            "num_comments": 8,
+        },
+    )
     
     def _generate_mock_signals(self) -> List[RawSignal]:
         """Generate mock Reddit signals for DRY_RUN mode."""
-        mock_posts = [
-            {
-                "title": "Looking for a reliable HVAC company in Miami - AC stopped working",
-                "selftext": "My AC unit is making weird noises and isn't cooling. Anyone know a good, honest HVAC technician in the Miami area?",
-                "subreddit": "Miami",
-                "score": 15,
-                "num_comments": 23,
-            },
-            {
-                "title": "Recommend a good roofing contractor in Fort Lauderdale?",
-                "selftext": "Need some roof repairs after the last storm. Looking for recommendations for a licensed roofer.",
-                "subreddit": "FortLauderdale",
-                "score": 8,
-                "num_comments": 12,
-            },
-            {
-                "title": "Best immigration attorney in South Florida?",
-                "selftext": "Looking for an experienced immigration lawyer. Need help with visa process. Any recommendations?",
-                "subreddit": "southflorida",
-                "score": 22,
-                "num_comments": 45,
-            },
-            {
-                "title": "Need help finding a plumber in Brickell area",
-                "selftext": "Have a leak under my kitchen sink. Anyone know a good plumber who does same-day service?",
-                "subreddit": "Miami",
-                "score": 5,
-                "num_comments": 8,
-            },
-        ]
         
-        signals = []
-        num_signals = random.randint(2, 4)
+        posts = random.choices(self.MOCK_POSTS, k=random.randint(2, 4))
+        created_utc = datetime.utcnow().timestamp()
         
-        for i in range(num_signals):
-            post = random.choice(mock_posts)
-            geography = self._subreddit_to_geography(post["subreddit"])
-            
-            signals.append(RawSignal(
+        signals = [
+            RawSignal(
                 source_name=self.name,
                 source_type="social",
                 raw_data={
@@ -2393,12 +3084,14 @@ class RedditSignalSource(SignalSource):
                     "score": post["score"],
                     "num_comments": post["num_comments"],
                     "permalink": f"/r/{post['subreddit']}/comments/mock{i}/",
-                    "created_utc": datetime.utcnow().timestamp(),
+                    "created_utc": created_utc,
                     "url": f"https://www.reddit.com/r/{post['subreddit']}/comments/mock{i}/",
                     "mock": True,
                 },
-                geography=geography,
-            ))
+                geography=self._subreddit_to_geography(post["subreddit"]),
+            )
+            for i, post in enumerate(posts)
+        ]
         
         log_signal_activity(
             self.name,
@@ -2410,16 +3103,10 @@ class RedditSignalSource(SignalSource):
         
         return signals
     
-    @property
-    def cooldown_seconds(self) -> int:
-        return 3600
-    
-    @property
-    def max_items_per_run(self) -> int:
-        return 30
-    
     def fetch(self) -> List[RawSignal]:
         """Fetch relevant posts from South Florida subreddits."""
+        import requests
+        
         if RedditSignalSource._blocked:
             print("[SIGNALNET][REDDIT] Source auto-disabled due to API blocking (403)")
             return []
@@ -2427,9 +3114,16 @@ class RedditSignalSource(SignalSource):
         signals = []
         blocked_count = 0
         
-        for subreddit in self.SUBREDDITS:
+        self._http_session()
+        with ThreadPoolExecutor(max_workers=len(self.SUBREDDITS)) as executor:
+            pending = [
+                (subreddit, executor.submit(self._fetch_subreddit_posts, subreddit))
+                for subreddit in self.SUBREDDITS
+            ]
+        
+        for subreddit, future in pending:
             try:
-                posts = self._fetch_subreddit_posts(subreddit)
+                posts = future.result()
                 for post in posts:
                     if self._is_relevant_post(post):
                         geography = self._subreddit_to_geography(subreddit)
@@ -2450,8 +3144,6 @@ class RedditSignalSource(SignalSource):
                             geography=geography,
                         ))
                 
-                time.sleep(2)
-                
             except requests.HTTPError as e:
                 if e.response is not None and e.response.status_code == 403:
                     blocked_count += 1
@@ -2475,21 +3167,41 @@ class RedditSignalSource(SignalSource):
     
     def _fetch_subreddit_posts(self, subreddit: str, limit: int = 50) -> List[Dict]:
         """Fetch recent posts from a subreddit using public JSON API."""
+        import requests
+        
         url = f"{self.REDDIT_BASE_URL}/r/{subreddit}/new.json"
         params = {"limit": limit}
         headers = {
             "User-Agent": "HossAgent/1.0 (Business Signal Detection; +https://hossagent.net)"
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=15)
-        
-        if response.status_code == 403:
-            print(f"[SIGNALNET][REDDIT] Blocked by Reddit (403) for r/{subreddit}")
-            raise requests.HTTPError("403 Blocked", response=response)
-        
-        response.raise_for_status()
+        with self._http_session().get(
+            url, params=params, headers=headers, timeout=15, stream=True
+        ) as response:
+            if response.status_code == 403:
+                print(f"[SIGNALNET][REDDIT] Blocked by Reddit (403) for r/{subreddit}")
+                raise requests.HTTPError("403 Blocked", response=response)
+            
+            response.raise_for_status()
+            
+            content_length = int(response.headers.get("Content-Length") or 0)
+            if content_length > self.MAX_RESPONSE_BYTES:
+                raise ValueError(
+                    f"Response too large for r/{subreddit}: {content_length} bytes"
+                )
+            
+            # Content-Length is the compressed size under gzip, so the cap is
+            # enforced again on the decoded bytes as they arrive.
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) > self.MAX_RESPONSE_BYTES:
+                    raise ValueError(
+                        f"Response too large for r/{subreddit}: over {self.MAX_RESPONSE_BYTES} bytes decoded"
+                    )
+            
+            data = _loads_json(body)
         
-        data = response.json()
         posts = []
         
         for child in data.get("data", {}).get("children", []):
@@ -2503,64 +3215,42 @@ class RedditSignalSource(SignalSource):
         selftext = post.get("selftext", "").lower()
         content = title + " " + selftext
         
-        return any(keyword in content for keyword in self.SERVICE_KEYWORDS)
+        return self._SERVICE_KEYWORDS_RE.search(content) is not None
     
     def _subreddit_to_geography(self, subreddit: str) -> str:
         """Map subreddit to geography."""
-        mapping = {
-            "Miami": "Miami",
-            "FortLauderdale": "Fort Lauderdale",
-            "southflorida": "South Florida",
-        }
-        return mapping.get(subreddit, "South Florida")
+        return self.SUBREDDIT_GEOGRAPHY.get(subreddit, "South Florida")
     
-    def _extract_niche(self, title: str, selftext: str) -> Optional[str]:
-        """Extract potential business niche from post content."""
-        content = (title + " " + selftext).lower()
-        
-        niche_patterns = {
-            "HVAC": ["hvac", "ac ", "a/c", "air conditioning", "heating", "cooling"],
-            "Roofing": ["roof", "roofing", "roofer", "shingles"],
-            "Plumbing": ["plumber", "plumbing", "pipe", "drain", "water heater"],
-            "Electrical": ["electrician", "electrical", "wiring"],
-            "Legal": ["lawyer", "attorney", "legal"],
-            "Medical": ["doctor", "clinic", "medical", "dentist"],
-            "Automotive": ["mechanic", "auto", "car repair"],
-            "Home Services": ["handyman", "contractor", "renovation", "remodel"],
-            "Moving": ["moving company", "movers", "relocation"],
-        }
-        
-        for niche, keywords in niche_patterns.items():
-            if any(kw in content for kw in keywords):
+    def _extract_niche(self, content: str) -> Optional[str]:
+        """Extract potential business niche from lowercased post content (title + selftext)."""
+        for pattern, niche in self.NICHE_PATTERNS:
+            if pattern.search(content):
                 return niche
         
         return None
     
-    def _infer_category(self, post: Dict) -> str:
-        """Infer signal category from post content."""
-        title = post.get("title", "").lower()
-        selftext = post.get("selftext", "").lower()
-        content = title + " " + selftext
-        
-        if any(kw in content for kw in ["recommend", "looking for", "anyone know", "who do you use"]):
-            return "OPPORTUNITY"
-        elif any(kw in content for kw in ["need help", "urgent", "emergency"]):
+    def _infer_category(self, content: str) -> str:
+        """Infer signal category from lowercased post content (title + selftext)."""
+        if self._REQUEST_RE.search(content):
             return "OPPORTUNITY"
-        elif any(kw in content for kw in ["new business", "opening", "just opened"]):
+        elif self._GROWTH_RE.search(content):
             return "GROWTH_SIGNAL"
         else:
             return "OPPORTUNITY"
     
     def parse(self, raw: RawSignal) -> ParsedSignal:
         """Parse Reddit post into standardized format."""
-        title = raw.raw_data.get("title", "Reddit post")
-        selftext = raw.raw_data.get("selftext", "")
-        subreddit = raw.raw_data.get("subreddit", "")
-        score = raw.raw_data.get("score", 0)
-        num_comments = raw.raw_data.get("num_comments", 0)
+        # fetch() and the mock generator always populate these keys
+        data = raw.raw_data
+        title = data["title"]
+        selftext = data["selftext"]
+        subreddit = data["subreddit"]
+        score = data["score"]
+        num_comments = data["num_comments"]
         
-        category = self._infer_category(raw.raw_data)
-        niche = self._extract_niche(title, selftext)
+        content = (title + " " + selftext).lower()
+        category = self._infer_category(content)
+        niche = self._extract_niche(content)
         
         context = f"Reddit r/{subreddit}: {title}"
         engagement = f"(Score: {score}, Comments: {num_comments})"
@@ -2568,7 +3258,7 @@ class RedditSignalSource(SignalSource):
         
         return ParsedSignal(
             source_type="social",
-            raw_payload=json.dumps(raw.raw_data),
+            raw_payload=_dumps_payload(raw.raw_data),
             context_summary=context[:500],
             geography=raw.geography,
             category_hint=category,
@@ -2592,7 +3282,7 @@ class JobBoardSignalSource(SignalSource):
     
     def is_enabled(self) -> bool:
         """Enable in both SANDBOX and PRODUCTION."""
-        return SIGNAL_MODE in ("SANDBOX", "PRODUCTION")
+        return SIGNAL_MODE in _RUN_MODES
     
     def fetch(self) -> List[RawSignal]:
         """Fetch job postings from job boards."""
@@ -2651,7 +3341,7 @@ class JobBoardSignalSource(SignalSource):
         
         return ParsedSignal(
             source_type="job_board",
-            raw_payload=json.dumps(data),
+            raw_payload=_dumps_payload(data),
             context_summary=summary[:500],
             geography=raw.geography,
             category_hint="JOB_POSTING",
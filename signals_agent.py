@@ -43,12 +43,13 @@ Default fallbacks if env vars not set:
 ============================================================================
 """
 
-import json
 import random
 import os
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional, Dict, Sequence
-from sqlmodel import Session, select
+from sqlmodel import Session, select, func
 
 from models import (
     Signal, LeadEvent, Customer, Lead,
@@ -65,6 +66,9 @@ from signal_sources import (
     SIGNAL_MODE,
     LEAD_GEOGRAPHY as SIGNALNET_GEOGRAPHY,
     LEAD_NICHE as SIGNALNET_NICHE,
+    _compile_keywords,
+    _RECOMMENDED_ACTIONS,
+    _DEFAULT_ACTION,
 )
 
 
@@ -76,17 +80,28 @@ LEAD_GEOGRAPHY = os.environ.get("LEAD_GEOGRAPHY", "Miami, Broward, South Florida
 LEAD_NICHE = os.environ.get("LEAD_NICHE", "HVAC, Roofing, Med Spa, Immigration Attorney")
 
 # Parse LEAD_GEOGRAPHY into searchable list for matching
-LEAD_GEOGRAPHY_LIST = [g.strip().lower() for g in LEAD_GEOGRAPHY.split(",")]
+LEAD_GEOGRAPHY_LIST = tuple(g.strip().lower() for g in LEAD_GEOGRAPHY.split(","))
 
 # Parse LEAD_NICHE into searchable list for industry matching
-LEAD_NICHE_LIST = [n.strip().lower() for n in LEAD_NICHE.split(",")]
+LEAD_NICHE_LIST = tuple(n.strip().lower() for n in LEAD_NICHE.split(","))
+
+# One alternation per list, so a match check is a single regex scan of the
+# input instead of one substring scan per configured target. The lists are
+# tuples because the patterns are compiled from them once at import.
+_LEAD_GEOGRAPHY_RE = _compile_keywords(LEAD_GEOGRAPHY_LIST)
+_LEAD_NICHE_RE = _compile_keywords(LEAD_NICHE_LIST)
 
 # Log configuration at module load (startup) - include SignalNet mode
 print(f"[SIGNALS][STARTUP] Mode: {SIGNAL_MODE}")
 print(f"[SIGNALS][STARTUP] Geography: {LEAD_GEOGRAPHY}, Niche: {LEAD_NICHE}")
 
+# Source status is logged on the first agent run rather than at import, so
+# importing this module (routes, scripts) doesn't walk the source registry
+_sources_status_logged = False
+
+
 def _log_signalnet_sources_status():
-    """Log status of SignalNet sources at startup."""
+    """Log status of SignalNet sources once, on the first agent run."""
     status = get_signal_status()
     registry = status.get("registry", {})
     sources = registry.get("sources", [])
@@ -99,8 +114,6 @@ def _log_signalnet_sources_status():
     if disabled_sources:
         print(f"[SIGNALS][STARTUP] Disabled sources: {', '.join(disabled_sources)}")
 
-_log_signalnet_sources_status()
-
 
 # Miami-specific industry verticals - high-value niches for South Florida market
 MIAMI_INDUSTRIES = [
@@ -117,6 +130,7 @@ MIAMI_AREAS = [
 ]
 
 
+@lru_cache(maxsize=256)
 def matches_lead_geography(geography: Optional[str]) -> bool:
     """
     Check if a geography string matches the configured LEAD_GEOGRAPHY.
@@ -132,10 +146,10 @@ def matches_lead_geography(geography: Optional[str]) -> bool:
     """
     if not geography:
         return False
-    geo_lower = geography.lower()
-    return any(target in geo_lower for target in LEAD_GEOGRAPHY_LIST)
+    return _LEAD_GEOGRAPHY_RE.search(geography.lower()) is not None
 
 
+@lru_cache(maxsize=256)
 def matches_lead_niche(niche: Optional[str]) -> bool:
     """
     Check if a niche string matches the configured LEAD_NICHE.
@@ -151,8 +165,7 @@ def matches_lead_niche(niche: Optional[str]) -> bool:
     """
     if not niche:
         return False
-    niche_lower = niche.lower()
-    return any(target in niche_lower for target in LEAD_NICHE_LIST)
+    return _LEAD_NICHE_RE.search(niche.lower()) is not None
 
 
 def infer_category(signal_type: str, context: str) -> str:
@@ -184,12 +197,23 @@ def infer_category(signal_type: str, context: str) -> str:
         return "GROWTH_SIGNAL"
     elif "review" in context_lower:
         return "REPUTATION_CHANGE"
-    elif "price" in context_lower or "pricing" in context_lower:
+    elif "price" in context_lower:  # "pricing" already matched COMPETITOR_SHIFT
         return "MIAMI_PRICE_MOVE"
     else:
         return "OPPORTUNITY"
 
 
+# Category base urgency (Miami-tuned); anything else starts at 50
+_BASE_SCORES = {
+    "HURRICANE_SEASON": 75,  # Highest priority - critical for South Florida
+    "REPUTATION_CHANGE": 70,
+    "COMPETITOR_SHIFT": 65,
+    "GROWTH_SIGNAL": 60,
+    "MIAMI_PRICE_MOVE": 60,
+    "BILINGUAL_OPPORTUNITY": 55,
+}
+
+
 def calculate_urgency(signal_type: str, category: str, geography: Optional[str] = None, niche: Optional[str] = None) -> int:
     """
     Calculate urgency score 0-100 based on signal characteristics.
@@ -218,30 +242,13 @@ def calculate_urgency(signal_type: str, category: str, geography: Optional[str]
         Urgency score 0-100 (clamped to 30-95 range)
     """
     # Base scores - Miami-tuned categories get higher weights
-    base_score = 50
-    
-    if category == "HURRICANE_SEASON":
-        base_score = 75  # Highest priority - critical for South Florida
-    elif category == "REPUTATION_CHANGE":
-        base_score = 70
-    elif category == "COMPETITOR_SHIFT":
-        base_score = 65
-    elif category == "GROWTH_SIGNAL":
-        base_score = 60
-    elif category == "MIAMI_PRICE_MOVE":
-        base_score = 60
-    elif category == "BILINGUAL_OPPORTUNITY":
-        base_score = 55
+    base_score = _BASE_SCORES.get(category, 50)
     
     # Miami-first targeting: Boost signals from LEAD_GEOGRAPHY
-    geography_boost = 0
-    if geography and matches_lead_geography(geography):
-        geography_boost = 15
+    geography_boost = 15 if matches_lead_geography(geography) else 0
     
     # Boost signals matching LEAD_NICHE industries
-    niche_boost = 0
-    if niche and matches_lead_niche(niche):
-        niche_boost = 10
+    niche_boost = 10 if matches_lead_niche(niche) else 0
     
     # Add random variation for natural distribution
     variation = random.randint(-10, 10)
@@ -259,16 +266,11 @@ def generate_recommended_action(category: str, signal_summary: str) -> str:
     Categories like HURRICANE_SEASON, BILINGUAL_OPPORTUNITY, and MIAMI_PRICE_MOVE
     have Miami-specific recommended actions.
     """
-    actions = {
-        "HURRICANE_SEASON": "Offer hurricane-season discount bundle or preparedness package",
-        "COMPETITOR_SHIFT": "Send competitive analysis snapshot highlighting your differentiators",
-        "GROWTH_SIGNAL": "Propose partnership or capacity-building services",
-        "BILINGUAL_OPPORTUNITY": "Highlight bilingual staff on homepage - big ROI in Miami market",
-        "REPUTATION_CHANGE": "Offer reputation management or customer experience audit",
-        "MIAMI_PRICE_MOVE": "Prepare market pricing comparison and value proposition",
-        "OPPORTUNITY": "Send contextual outreach with relevant service offer"
-    }
-    return actions.get(category, "Prepare contextual outreach based on signal")
+    return _RECOMMENDED_ACTIONS.get(category, _DEFAULT_ACTION)
+
+
+# sources_run entries are asdict(SourceResult), so every field is present
+_source_report_fields = itemgetter("source", "fetched", "persisted", "events_created", "error")
 
 
 def run_signals_agent(session: Session, max_signals: int = 10) -> Dict:
@@ -288,11 +290,18 @@ def run_signals_agent(session: Session, max_signals: int = 10) -> Dict:
     
     Returns dict with counts of signals and events generated, plus source details.
     """
-    print(f"[SIGNALS] ============================================================")
-    print(f"[SIGNALS] Starting Signals Agent cycle - Mode: {SIGNAL_MODE}")
-    print(f"[SIGNALS] Geography: {LEAD_GEOGRAPHY}")
-    print(f"[SIGNALS] Niche: {LEAD_NICHE}")
-    print(f"[SIGNALS] ============================================================")
+    global _sources_status_logged
+    if not _sources_status_logged:
+        _log_signalnet_sources_status()
+        _sources_status_logged = True
+    
+    print(
+        "[SIGNALS] ============================================================\n"
+        f"[SIGNALS] Starting Signals Agent cycle - Mode: {SIGNAL_MODE}\n"
+        f"[SIGNALS] Geography: {LEAD_GEOGRAPHY}\n"
+        f"[SIGNALS] Niche: {LEAD_NICHE}\n"
+        "[SIGNALS] ============================================================"
+    )
     
     if SIGNAL_MODE == "OFF":
         print("[SIGNALS] SIGNAL_MODE is OFF - skipping SignalNet pipeline entirely")
@@ -310,34 +319,38 @@ def run_signals_agent(session: Session, max_signals: int = 10) -> Dict:
     
     signals_from_pipeline = pipeline_result.get("signals_persisted", 0)
     events_from_pipeline = pipeline_result.get("events_created", 0)
+    sources_checked = pipeline_result.get("sources_checked", 0)
+    sources_eligible = pipeline_result.get("sources_eligible", 0)
+    signals_fetched = pipeline_result.get("signals_fetched", 0)
     sources_run = pipeline_result.get("sources_run", [])
     errors = pipeline_result.get("errors", [])
     
-    print(f"[SIGNALS] SignalNet pipeline results:")
-    print(f"[SIGNALS]   - Sources checked: {pipeline_result.get('sources_checked', 0)}")
-    print(f"[SIGNALS]   - Sources eligible: {pipeline_result.get('sources_eligible', 0)}")
-    print(f"[SIGNALS]   - Signals fetched: {pipeline_result.get('signals_fetched', 0)}")
-    print(f"[SIGNALS]   - Signals persisted: {signals_from_pipeline}")
-    print(f"[SIGNALS]   - Events created: {events_from_pipeline}")
+    # Collect the cycle report and print it in one write, so it stays in one
+    # piece when other agents log from the event loop at the same time
+    report = [
+        "[SIGNALS] SignalNet pipeline results:",
+        f"[SIGNALS]   - Sources checked: {sources_checked}",
+        f"[SIGNALS]   - Sources eligible: {sources_eligible}",
+        f"[SIGNALS]   - Signals fetched: {signals_fetched}",
+        f"[SIGNALS]   - Signals persisted: {signals_from_pipeline}",
+        f"[SIGNALS]   - Events created: {events_from_pipeline}",
+    ]
     
     for source_result in sources_run:
-        source_name = source_result.get("source", "unknown")
-        fetched = source_result.get("fetched", 0)
-        persisted = source_result.get("persisted", 0)
-        events = source_result.get("events_created", 0)
-        error = source_result.get("error")
+        source_name, fetched, persisted, events, error = _source_report_fields(source_result)
         
         if error:
-            print(f"[SIGNALS][{source_name.upper()}] ERROR: {error}")
+            report.append(f"[SIGNALS][{source_name.upper()}] ERROR: {error}")
         else:
-            print(f"[SIGNALS][{source_name.upper()}] Fetched: {fetched}, Persisted: {persisted}, Events: {events}")
+            report.append(f"[SIGNALS][{source_name.upper()}] Fetched: {fetched}, Persisted: {persisted}, Events: {events}")
     
     if errors:
-        print(f"[SIGNALS] Pipeline errors:")
+        report.append("[SIGNALS] Pipeline errors:")
         for err in errors:
-            print(f"[SIGNALS]   - {err.get('source')}: {err.get('error')}")
+            report.append(f"[SIGNALS]   - {err.get('source')}: {err.get('error')}")
     
-    print(f"[SIGNALS] Cycle complete. Mode: {SIGNAL_MODE}, Signals: {signals_from_pipeline}, Events: {events_from_pipeline}")
+    report.append(f"[SIGNALS] Cycle complete. Mode: {SIGNAL_MODE}, Signals: {signals_from_pipeline}, Events: {events_from_pipeline}")
+    print("\n".join(report))
     
     return {
         "signals_created": signals_from_pipeline,
@@ -364,23 +377,25 @@ def get_todays_opportunities(
     
     Sorted by urgency_score desc, then by created_at desc.
     """
-    query = select(LeadEvent).order_by(
-        LeadEvent.urgency_score.desc(),
-        LeadEvent.created_at.desc()
-    ).limit(limit)
+    filters = []
     
     if company_id:
-        query = query.where(LeadEvent.company_id == company_id)
+        filters.append(LeadEvent.company_id == company_id)
     
     if enrichment_status:
-        query = query.where(LeadEvent.enrichment_status == enrichment_status)
+        filters.append(LeadEvent.enrichment_status == enrichment_status)
     elif include_review_mode:
-        query = query.where(LeadEvent.enrichment_status.in_([
+        filters.append(LeadEvent.enrichment_status.in_([
             ENRICHMENT_STATUS_OUTBOUND_SENT,
             ENRICHMENT_STATUS_ENRICHED_NO_OUTBOUND
         ]))
     else:
-        query = query.where(LeadEvent.enrichment_status == ENRICHMENT_STATUS_OUTBOUND_SENT)
+        filters.append(LeadEvent.enrichment_status == ENRICHMENT_STATUS_OUTBOUND_SENT)
+    
+    query = select(LeadEvent).where(*filters).order_by(
+        LeadEvent.urgency_score.desc(),
+        LeadEvent.created_at.desc()
+    ).limit(limit)
     
     return session.exec(query).all()
 
@@ -416,12 +431,15 @@ def get_lead_events_counts_by_status(session: Session) -> Dict[str, int]:
         ENRICHMENT_STATUS_OUTBOUND_SENT,
     ]
     
-    counts = {}
-    for status in statuses:
-        count = len(session.exec(
-            select(LeadEvent).where(LeadEvent.enrichment_status == status)
-        ).all())
-        counts[status] = count
+    # One GROUP BY instead of loading every row of each status to len() it
+    rows = session.exec(
+        select(LeadEvent.enrichment_status, func.count())
+        .where(LeadEvent.enrichment_status.in_(statuses))
+        .group_by(LeadEvent.enrichment_status)
+    ).all()
+    
+    counts = {status: 0 for status in statuses}
+    counts.update(rows)
     
     return counts
 